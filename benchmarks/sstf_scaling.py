@@ -0,0 +1,29 @@
+# Run from the repository root: python -m benchmarks.sstf_scaling
+import argparse
+import random
+import time
+
+from core.sstf import sstf
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def run(sizes, disk_size, seed):
+    rng = random.Random(seed)
+    print(f"{'requests':>10} {'seconds':>10} {'requests/s':>14}")
+    for n in sizes:
+        requests = [rng.randrange(disk_size) for _ in range(n)]
+        head = rng.randrange(disk_size)
+        start = time.perf_counter()
+        sstf(requests, head)
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} {elapsed:>10.3f} {n / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SSTF scaling benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--disk-size", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    run(args.sizes, args.disk_size, args.seed)
@@ -0,0 +1,130 @@
+# Run from the repository root:
+#   python -m benchmarks.suite --sizes 1000 100000 --output baseline.json
+#   python -m benchmarks.suite --sizes 1000 100000 --compare baseline.json
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from core.registry import available, get_scheduler
+from traces.synthetic import generate
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DISK_SIZE = 10_000
+# Run unless -a names others; the rest of the registry is opt-in here
+CORE_ALGORITHMS = ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]
+
+
+# Workload name -> (traces.synthetic pattern, pattern parameters)
+WORKLOADS = {
+    "uniform": ("uniform", {}),
+    "zipf": ("zipf", {}),
+    "sequential": ("sequential", {"jump_probability": 1 / 64}),
+    "bimodal": ("hotspot", {"spread": 0.05, "hot_fraction": 1.0}),
+}
+
+
+def measure(algo, requests, head, repeat):
+    scheduler = get_scheduler(algo)
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scheduler.run(requests, head, "right", DISK_SIZE)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    # tracemalloc slows everything down, so peak memory gets its own run
+    tracemalloc.start()
+    scheduler.run(requests, head, "right", DISK_SIZE)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "peak_bytes": peak,
+        "requests_per_sec": len(requests) / seconds if seconds else 0,
+    }
+
+
+def run(sizes, workloads, algorithms, repeat, seed):
+    results = []
+    for workload in workloads:
+        for n in sizes:
+            pattern, params = WORKLOADS[workload]
+            requests = generate(n, pattern, DISK_SIZE, seed, **params)[0].tolist()
+            head = DISK_SIZE // 2
+            for algo in algorithms:
+                row = {"algorithm": algo, "workload": workload, "size": n}
+                row.update(measure(algo, requests, head, repeat))
+                results.append(row)
+                print(f"{algo:>7} {workload:>10} {n:>10} {row['seconds']:>10.4f}s "
+                      f"{row['peak_bytes'] / 2**20:>9.1f} MiB {row['requests_per_sec']:>14,.0f} req/s",
+                      file=sys.stderr)
+    return results
+
+
+def compare_to_baseline(results, baseline, threshold, min_seconds=0.0):
+    """Return the rows that got slower than the baseline by more than threshold.
+
+    Cases faster than min_seconds in both runs are skipped as timer noise.
+    """
+    previous = {(r["algorithm"], r["workload"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = previous.get((row["algorithm"], row["workload"], row["size"]))
+        if old is None or not old["seconds"]:
+            continue
+        if max(row["seconds"], old["seconds"]) < min_seconds:
+            continue
+        change = row["seconds"] / old["seconds"] - 1
+        if change > threshold:
+            regressions.append((row, old, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the core disk schedulers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("-a", "--algorithms", nargs="+", type=str.upper,
+                        choices=available(include_opt_in=True), default=CORE_ALGORITHMS,
+                        metavar="ALGO")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="fail if any case is slower than this baseline by more than --threshold")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown as a fraction (default: 0.2)")
+    parser.add_argument("--min-seconds", type=float, default=0.01,
+                        help="ignore cases faster than this when comparing (default: 0.01)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.workloads, args.algorithms, args.repeat, args.seed)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "disk_size": DISK_SIZE,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold, args.min_seconds)
+        for row, old, change in regressions:
+            print(f"REGRESSION {row['algorithm']} {row['workload']} {row['size']}: "
+                  f"{old['seconds']:.4f}s -> {row['seconds']:.4f}s (+{change:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
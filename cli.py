@@ -0,0 +1,352 @@
+import argparse
+import csv
+import json
+import re
+import sys
+
+from core.cache import ResultCache
+from core.compare import compare
+from core.cost import SEEK_CURVES, DriveModel, TableSeek
+from core.raid import DEFAULT_STRIPE, LAYOUTS, compare_array
+from core.registry import available
+from core.result import ScheduleResult
+from core.sptf import split_positions
+from traces.readers import READERS, iter_chunks, max_sector, read_trace, schedule_chunks
+
+DEFAULT_DISK_SIZE = 200
+
+
+def parse_requests(text):
+    """Parse track numbers, or track:angle pairs, into (tracks, angles)."""
+    return split_positions(token for token in re.split(r"[,\s]+", text.strip()) if token)
+
+
+def algorithm_name(value):
+    name = value.upper()
+    if name not in available(include_opt_in=True):
+        raise argparse.ArgumentTypeError(
+            f"unknown algorithm {value!r} "
+            f"(choose from {', '.join(available(include_opt_in=True))})")
+    return name
+
+
+REQUEST_COLUMNS = ["seek_p50", "seek_p90", "seek_p99", "seek_max", "seek_variance",
+                   "wait_p50", "wait_p90", "wait_p99", "wait_max", "wait_variance", "fairness"]
+
+
+def _joined(sequence, separator=", ", block=65536):
+    # Comma separated text of a long sequence, a block of entries at a time
+    for start in range(0, len(sequence), block):
+        yield (separator if start else "") + separator.join(map(str, sequence[start:start + block]))
+
+
+def write_text(results, out, show_sequence):
+    out.write("Comparison Results:\n\n")
+    for algo, result in results.items():
+        out.write(f"Algorithm: {algo}\n")
+        if show_sequence:
+            # Written out in full; the text is streamed, never held as one string
+            out.write("Sequence: [")
+            out.writelines(_joined(result.sequence))
+            out.write("]\n")
+        out.write(
+            f"Total Seek Time: {result.total_seek_time}\n"
+            f"Average Seek Time: {result.average_seek_time:.2f}\n"
+            f"Throughput: {result.throughput:.2f} requests per unit time\n"
+            f"Modeled Time: {result.total_ms:.2f} ms\n"
+            f"IOPS: {result.iops:.1f}\n"
+            f"Max Wait: {result.max_wait} places behind arrival order\n"
+        )
+        if result.deadline_misses is not None:
+            out.write(f"Deadline Misses: {result.deadline_misses}\n")
+        if result.request_metrics is not None:
+            summary = result.request_metrics.summary()
+            histogram = summary["seek_histogram"]
+            edges = histogram["edges"]
+            out.write(
+                f"Seek p50/p90/p99/max: {summary['seek_p50']:.1f} / {summary['seek_p90']:.1f} / "
+                f"{summary['seek_p99']:.1f} / {summary['seek_max']}\n"
+                f"Seek Variance: {summary['seek_variance']:.1f}\n"
+                f"Wait p50/p90/p99/max: {summary['wait_p50']:.1f} / {summary['wait_p90']:.1f} / "
+                f"{summary['wait_p99']:.1f} / {summary['wait_max']} tracks\n"
+                f"Wait Variance: {summary['wait_variance']:.1f}\n"
+                f"Fairness (Jain): {summary['fairness']:.3f}\n"
+                f"Seek Histogram: " + ", ".join(
+                    f"{low}-{high - 1}: {count}"
+                    for low, high, count in zip(edges, edges[1:], histogram["counts"])) + "\n"
+            )
+        out.write(f"{'-'*60}\n")
+
+
+def write_json(results, out, show_sequence):
+    rows = []
+    for algo, result in results.items():
+        row = {"algorithm": algo, **result.summary()}
+        if result.request_metrics is not None:
+            row["per_request"] = result.request_metrics.summary()
+        if show_sequence:
+            row["sequence"] = result.sequence.tolist()
+        rows.append(row)
+    json.dump(rows, out, indent=2)
+    out.write("\n")
+
+
+def write_csv(results, out, show_sequence):
+    writer = csv.writer(out)
+    header = ["algorithm", "total_seek_time", "average_seek_time", "throughput", "total_ms", "iops",
+              "max_wait"]
+    misses = any(result.deadline_misses is not None for result in results.values())
+    if misses:
+        header.append("deadline_misses")
+    per_request = any(result.request_metrics is not None for result in results.values())
+    if per_request:
+        header += REQUEST_COLUMNS
+    writer.writerow(header + ["sequence"] if show_sequence else header)
+    for algo, result in results.items():
+        row = [algo, result.total_seek_time, f"{result.average_seek_time:.6f}",
+               f"{result.throughput:.6f}", f"{result.total_ms:.6f}", f"{result.iops:.6f}",
+               result.max_wait]
+        if misses:
+            row.append("" if result.deadline_misses is None else result.deadline_misses)
+        if per_request:
+            request_metrics = result.request_metrics
+            summary = request_metrics.summary() if request_metrics is not None else {}
+            row += [f"{summary[name]:.6f}" if isinstance(summary.get(name), float)
+                    else summary.get(name, "") for name in REQUEST_COLUMNS]
+        if show_sequence:
+            row.append("".join(_joined(result.sequence, " ")))
+        writer.writerow(row)
+
+
+WRITERS = {"text": write_text, "json": write_json, "csv": write_csv}
+
+ARRAY_COLUMNS = ["disk", "requests", "total_seek_time", "total_ms", "iops", "max_wait",
+                 "utilization"]
+
+
+def write_array_text(results, out):
+    out.write("Array Comparison Results:\n\n")
+    for algo, result in results.items():
+        summary = result.summary()
+        out.write(
+            f"Algorithm: {algo} on {summary['layout']} x {summary['disks']}\n"
+            f"Total Seek Time: {summary['total_seek_time']}\n"
+            f"Array Time: {summary['makespan_ms']:.2f} ms\n"
+            f"IOPS: {summary['iops']:.1f}\n"
+            f"Max Wait: {summary['max_wait']} places behind arrival order\n"
+            f"Hot Disk: {summary['hot_disk']} (imbalance {summary['imbalance']:.2f}x)\n"
+        )
+        for row in result.disk_rows():
+            out.write(
+                f"  Disk {row['disk']}: {row['requests']} requests, "
+                f"seek {row['total_seek_time']}, {row['total_ms']:.2f} ms, "
+                f"{row['iops']:.1f} IOPS, {row['utilization']:.0%} busy\n"
+            )
+        out.write(f"{'-'*60}\n")
+
+
+def write_array_json(results, out):
+    rows = []
+    for algo, result in results.items():
+        rows.append({"algorithm": algo, **result.summary(), "members": [
+            {name: row[name] for name in ARRAY_COLUMNS} for row in result.disk_rows()]})
+    json.dump(rows, out, indent=2)
+    out.write("\n")
+
+
+def write_array_csv(results, out):
+    # One row per member disk plus an "all" row with the array totals. Only
+    # the "all" row has an imbalance (busiest disk over the mean) and only
+    # the member rows have a utilization.
+    writer = csv.writer(out)
+    writer.writerow(["algorithm"] + ARRAY_COLUMNS + ["imbalance"])
+    for algo, result in results.items():
+        for row in result.disk_rows():
+            writer.writerow([algo] + [
+                f"{row[name]:.6f}" if isinstance(row[name], float) else row[name]
+                for name in ARRAY_COLUMNS] + [""])
+        summary = result.summary()
+        writer.writerow([algo, "all", summary["requests"], summary["total_seek_time"],
+                         f"{summary['makespan_ms']:.6f}", f"{summary['iops']:.6f}",
+                         summary["max_wait"], "", f"{summary['imbalance']:.6f}"])
+
+
+ARRAY_WRITERS = {"text": write_array_text, "json": write_array_json, "csv": write_array_csv}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Compare disk scheduling algorithms without the GUI.")
+    parser.add_argument("requests", nargs="?", default="-",
+                        help="file with comma or whitespace separated requests ('-' for stdin)")
+    parser.add_argument("--head", type=int, required=True, help="initial head position")
+    parser.add_argument("--disk-size", type=int,
+                        help="tracks on the disk (default: the size recorded in a .dst trace, "
+                             "otherwise 200)")
+    parser.add_argument("--direction", choices=["right", "left"], default="right")
+    opt_in = [name for name in available(include_opt_in=True) if name not in available()]
+    parser.add_argument("-a", "--algorithms", type=algorithm_name, nargs="+",
+                        default=available(), metavar="ALGO",
+                        help=f"algorithms to run (default: {', '.join(available())}; "
+                             f"others must be named: {', '.join(opt_in) or 'none'})")
+    parser.add_argument("-f", "--format", choices=list(WRITERS), default="text")
+    parser.add_argument("--sequence", action="store_true",
+                        help="include the service sequence in the output")
+    parser.add_argument("--per-request", action="store_true",
+                        help="add seek and wait percentiles, variance, fairness and a seek "
+                             "histogram over the individual requests")
+    parser.add_argument("--plot", metavar="IMAGE",
+                        help="also write the head movement of each algorithm to a PNG/SVG file")
+    parser.add_argument("--seek-model", choices=list(SEEK_CURVES), default="sqrt",
+                        help="seek curve used for the modeled milliseconds and IOPS")
+    parser.add_argument("--seek-profile", metavar="CSV",
+                        help="measured 'distance,ms' seek profile (overrides --seek-model)")
+    parser.add_argument("--rpm", type=int, default=7200,
+                        help="spindle speed for rotational latency (0 for none)")
+    parser.add_argument("--transfer-ms", type=float, default=0.0,
+                        help="transfer time added to every request")
+    parser.add_argument("--raid", choices=LAYOUTS,
+                        help="treat requests as logical tracks on an array of --disks members")
+    parser.add_argument("--disks", type=int, default=4, help="member disks in the array")
+    parser.add_argument("--stripe", type=int, default=DEFAULT_STRIPE,
+                        help="tracks per stripe unit on each member")
+    parser.add_argument("--write-ratio", type=float, default=0.0,
+                        help="share of array requests that are writes, picked at random "
+                             "(default: all reads)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for choosing which requests are writes")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="reuse results stored in DIR by earlier runs, and store new ones there")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes for large inputs (default: one per CPU)")
+    parser.add_argument("--trace-format", choices=list(READERS),
+                        help="treat the input file as a block I/O trace and stream it in chunks")
+    parser.add_argument("--max-sector", type=int,
+                        help="largest sector on the traced device (default: scan the trace for it)")
+    parser.add_argument("--chunk-size", type=int, default=65536,
+                        help="requests scheduled together when streaming a trace")
+    return parser
+
+
+def build_model(args, parser):
+    try:
+        seek = (TableSeek.from_csv(args.seek_profile) if args.seek_profile
+                else SEEK_CURVES[args.seek_model]())
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if args.rpm < 0:
+        parser.error("rpm cannot be negative")
+    return DriveModel(seek, args.rpm, args.transfer_ms)
+
+
+def run_trace(args, parser, model):
+    if args.requests == "-":
+        parser.error("traces must be read from a file")
+    if args.sequence or args.per_request:
+        parser.error("--sequence and --per-request are not available when streaming a trace")
+
+    try:
+        top = args.max_sector
+        if top is None:
+            top = max_sector(read_trace(args.requests, args.trace_format))
+        results = {}
+        for algo in dict.fromkeys(args.algorithms):
+            records = read_trace(args.requests, args.trace_format)
+            chunks = iter_chunks(records, args.disk_size, top, args.chunk_size)
+            # Streaming keeps totals only, so the result has no sequence
+            results[algo] = ScheduleResult(None, args.head, *schedule_chunks(
+                chunks, algo, args.head, args.direction, args.disk_size, model)[1:])
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    return results
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.disk_size is not None and args.disk_size <= 0:
+        parser.error("disk size must be positive")
+    model = build_model(args, parser)
+    if args.raid and (args.trace_format or args.plot or args.sequence or args.per_request):
+        parser.error("--raid cannot be combined with --trace-format, --plot, --sequence "
+                     "or --per-request")
+    if args.write_ratio and not args.raid:
+        parser.error("--write-ratio only applies to arrays (--raid)")
+    if args.trace_format:
+        args.disk_size = args.disk_size or DEFAULT_DISK_SIZE
+        if not 0 <= args.head < args.disk_size:
+            parser.error(f"head must be between 0 and {args.disk_size - 1}")
+        if args.plot:
+            parser.error("--plot is not available when streaming a trace")
+        WRITERS[args.format](run_trace(args, parser, model), sys.stdout, False)
+        return
+
+    angles = None
+    try:
+        if args.requests == "-":
+            requests, angles = parse_requests(sys.stdin.read())
+        elif args.requests.endswith(".dst"):
+            # Loaded on demand; only .dst inputs need the trace package
+            from traces.columnar import open_trace
+            requests = open_trace(args.requests)
+        else:
+            with open(args.requests) as f:
+                requests, angles = parse_requests(f.read())
+    except OSError as e:
+        parser.error(str(e))
+    except ValueError as e:
+        parser.error(str(e) if args.requests.endswith(".dst") else "requests must be integers")
+
+    if not requests:
+        parser.error("no requests given")
+    if args.requests.endswith(".dst"):
+        if args.disk_size is None:
+            args.disk_size = requests.disk_size
+        elif args.disk_size != requests.disk_size:
+            parser.error(f"--disk-size {args.disk_size} does not match the trace's disk size "
+                         f"{requests.disk_size}")
+    args.disk_size = args.disk_size or DEFAULT_DISK_SIZE
+    if not 0 <= args.head < args.disk_size:
+        parser.error(f"head must be between 0 and {args.disk_size - 1}")
+    if args.raid:
+        if args.stripe <= 0:
+            parser.error("stripe must be positive")
+        try:
+            writes = None
+            if args.write_ratio:
+                # Loaded on demand, like the trace package above
+                from traces.synthetic import write_mix
+                writes = write_mix(len(requests), args.write_ratio, args.seed)
+            results = compare_array(requests, args.head, list(dict.fromkeys(args.algorithms)),
+                                    args.raid, args.disks, args.disk_size, args.stripe,
+                                    args.direction, model, writes, max_workers=args.jobs)
+        except ValueError as e:
+            parser.error(str(e))
+        ARRAY_WRITERS[args.format](results, sys.stdout)
+        return
+    if isinstance(requests, list):
+        out_of_range = any(r < 0 or r >= args.disk_size for r in requests)
+    else:
+        out_of_range = requests.tracks.min() < 0 or requests.tracks.max() >= args.disk_size
+    if out_of_range:
+        parser.error(f"all requests must be between 0 and {args.disk_size - 1}")
+
+    algorithms = list(dict.fromkeys(args.algorithms))
+    cache = ResultCache(directory=args.cache_dir) if args.cache_dir else None
+    results = compare(requests, args.head, algorithms, args.direction, args.disk_size, args.jobs,
+                      cache, model, angles, args.per_request)
+    WRITERS[args.format](results, sys.stdout, args.sequence)
+    if cache is not None:
+        stats = cache.stats()
+        print(f"cache: {stats['hits']} hits, {stats['misses']} misses", file=sys.stderr)
+
+    if args.plot:
+        # Only pulled in when asked for, to keep matplotlib out of plain runs
+        from visualization.report import render_report
+        sequences = {algo: result.sequence for algo, result in results.items()}
+        render_report(sequences, args.head, args.disk_size, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from array import array
+from collections import OrderedDict
+
+from core.registry import get_scheduler
+
+DEFAULT_MAX_BYTES = 64 * 2**20
+# Part of every key; bump it when run_algorithm() results change shape or
+# meaning so stale entries in a cache directory are never read back.
+RESULT_FORMAT = 1
+
+
+def request_digest(requests, angles=None):
+    """Content hash of a request list, array or mapped trace (and its angles)."""
+    requests = getattr(requests, "tracks", requests)
+    if hasattr(requests, "astype"):
+        data = requests.astype("<i8").tobytes()  # NumPy, without importing it here
+    else:
+        data = array("q", requests).tobytes()
+    digest = hashlib.sha256(data)
+    if angles is not None:
+        digest.update(b"angles")
+        digest.update(array("d", angles).tobytes())
+    return digest.hexdigest()
+
+
+def result_key(digest, algo, head, direction="right", disk_size=200, model=None,
+               per_request=False):
+    # Parameters a policy ignores are left out so equivalent runs share a key.
+    # Schedulers and cost models identify themselves through their repr, so a
+    # name re-registered with other parameters gets fresh keys.
+    scheduler = get_scheduler(algo)
+    direction = direction if scheduler.uses_direction else "-"
+    disk_size = disk_size if scheduler.uses_disk_size else "-"
+    text = (f"{RESULT_FORMAT}|{digest}|{algo.upper()}|{scheduler!r}|{head}|{direction}"
+            f"|{disk_size}|{model!r}|{int(per_request)}")
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    """Content-addressed cache of run_algorithm() results.
+
+    The memory tier is an LRU bounded by an estimate of the bytes it holds.
+    When `directory` is given, results are also pickled there so other runs
+    and processes can pick them up.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+            self.memory_hits += 1
+            return result
+
+        if self.directory:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+            except OSError:
+                result = None
+            except Exception:
+                # Truncated, corrupt or from an incompatible version: unpickling
+                # can fail in many ways, and each is a miss. Drop the file so
+                # the next put() replaces it.
+                result = None
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            if result is not None:
+                self.disk_hits += 1
+                self._remember(key, result)
+                return result
+
+        self.misses += 1
+        return None
+
+    def put(self, key, result):
+        self._remember(key, result)
+        if self.directory:
+            # Write to a temporary file first so readers never see half a result
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self._path(key))
+            except OSError:
+                pass  # An unwritable cache directory only costs future hits
+            finally:
+                # Already gone after the replace; anything that failed left it behind
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _remember(self, key, result):
+        size = result.nbytes
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key).nbytes
+        self.entries[key] = result
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
@@ -1,8 +1,8 @@
 
-def clook(requests, head, direction="right", disk_size=200):
+def clook(requests, head, direction="right", disk_size=200, assume_sorted=False):
     total_seek_time = 0
     sequence = []
-    requests_sorted = sorted(requests)
+    requests_sorted = requests if assume_sorted else sorted(requests)
 
     if direction == "right":
         right = [r for r in requests_sorted if r >= head]
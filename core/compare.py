@@ -0,0 +1,202 @@
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from core.cache import request_digest, result_key
+from core.cost import DEFAULT_MODEL
+from core.cost import iops as request_rate
+from core.metrics import RequestMetrics, max_delay, seek_metrics
+from core.registry import (CLOOKScheduler, CSCANScheduler, FCFSScheduler, LOOKScheduler,
+                           SCANScheduler, get_scheduler)
+from core.result import ScheduleResult
+from core.sptf import positioned_time
+
+# Below this many requests a process pool costs more than it saves
+PARALLEL_THRESHOLD = 50_000
+
+
+def run_algorithm(algo, requests, head, direction="right", disk_size=200, model=None,
+                  angles=None, per_request=False, scheduler=None):
+    """Run one algorithm and return a core.result.ScheduleResult.
+
+    Seek time and throughput count tracks; total_ms and iops come from the
+    drive model (core.cost.DEFAULT_MODEL unless one is given). When request
+    angles are known, rotational delay follows them instead of the average.
+    max_wait is the most places any request was served behind its arrival
+    order (see core.metrics.service_delays). request_metrics is a
+    core.metrics.RequestMetrics when per_request is set and None otherwise.
+    deadline_misses is filled in for policies that report it (DEADLINE).
+    The scheduler's list is dropped once the compact result is built.
+
+    requests may also be a MappedTrace from traces.columnar. FCFS, SCAN,
+    C-SCAN, LOOK and C-LOOK then run on its track column through their
+    core.vectorized forms without copying it; any other policy (and any run
+    with angles) has no array form and gets the tracks as a list.
+
+    scheduler overrides the registry lookup of algo. Worker processes are
+    handed the instance this way, since schedulers registered at runtime
+    (or re-registered with other parameters) only exist in the parent.
+    """
+    model = model or DEFAULT_MODEL
+    scheduler = scheduler or get_scheduler(algo)
+    edges = []
+    stats = {}
+    outcome = None
+    tracks = getattr(requests, "tracks", None)
+    if tracks is not None:
+        requests = tracks
+        if angles is None:
+            outcome = _schedule_array(scheduler, tracks, head, direction, disk_size, edges)
+        if outcome is None:
+            requests = tracks.tolist()
+    if outcome is None:
+        outcome = scheduler.run(requests, head, direction, disk_size, angles, model, edges, stats)
+    sequence, total_seek_time = outcome
+    average_seek_time, throughput = seek_metrics(len(requests), total_seek_time)
+    if angles is None:
+        total_ms, iops = model.evaluate(sequence, head, len(requests))
+    else:
+        total_ms = positioned_time(sequence, head, requests, angles, model)
+        iops = request_rate(len(requests), total_ms)
+    max_wait = max_delay(requests, sequence, edges)
+    request_metrics = (RequestMetrics.from_sequence(requests, sequence, head, edges)
+                       if per_request else None)
+    return ScheduleResult(sequence, head, total_seek_time, average_seek_time, throughput, total_ms,
+                          iops, max_wait, request_metrics, stats.get("deadline_misses"))
+
+
+def _schedule_array(scheduler, tracks, head, direction, disk_size, edges):
+    # Imported here; only mapped traces, which already need NumPy, get here
+    from core.vectorized import clook_array, cscan_array, fcfs_array, look_array, scan_array
+
+    kind = type(scheduler)
+    if kind is FCFSScheduler:
+        return fcfs_array(tracks, head)
+    if kind is SCANScheduler:
+        return scan_array(tracks, head, direction, disk_size, edges=edges)
+    if kind is CSCANScheduler:
+        return cscan_array(tracks, head, direction, disk_size, edges=edges)
+    if kind is LOOKScheduler:
+        return look_array(tracks, head, direction, disk_size)
+    if kind is CLOOKScheduler:
+        return clook_array(tracks, head, direction, disk_size)
+    return None
+
+
+def _run_shared(shm_name, length, algo, scheduler, head, direction, disk_size, model, angles,
+                per_request):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf[:length * 8].cast("q")
+        requests = view.tolist()
+        view.release()
+    finally:
+        shm.close()
+    return algo, run_algorithm(algo, requests, head, direction, disk_size, model, angles,
+                               per_request, scheduler)
+
+
+def _run_mapped(trace_path, algo, scheduler, head, direction, disk_size, model, per_request):
+    # Imported here; only runs replaying a mapped trace need it
+    from traces.columnar import open_trace
+
+    return algo, run_algorithm(algo, open_trace(trace_path), head, direction, disk_size, model,
+                               per_request=per_request, scheduler=scheduler)
+
+
+def _run_pool(tasks, workers):
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(*task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def iter_compare(requests, head, algorithms, direction="right", disk_size=200, max_workers=None,
+                 cache=None, model=None, angles=None, per_request=False):
+    """Yield (algorithm, result) pairs in the order the algorithms finish.
+
+    requests may be a list of tracks or a MappedTrace from traces.columnar;
+    a MappedTrace is not parsed, and policies with an array form run on it
+    in place (see run_algorithm). angles optionally gives the rotational position of each request in
+    degrees. With a ResultCache, cached results are yielded first and only
+    the rest are computed. per_request adds per-request metrics to every
+    result (see run_algorithm).
+    """
+    algorithms = list(algorithms)
+    if cache is None:
+        yield from _iter_compute(requests, head, algorithms, direction, disk_size, max_workers,
+                                 model, angles, per_request)
+        return
+
+    digest = request_digest(requests, angles)
+    keys = {}
+    for algo in algorithms:
+        key = result_key(digest, algo, head, direction, disk_size, model or DEFAULT_MODEL,
+                         per_request)
+        result = cache.get(key)
+        if result is None:
+            keys[algo] = key
+        else:
+            yield algo, result
+
+    for algo, result in _iter_compute(requests, head, list(keys), direction, disk_size, max_workers,
+                                      model, angles, per_request):
+        cache.put(keys[algo], result)
+        yield algo, result
+
+
+def _iter_compute(requests, head, algorithms, direction, disk_size, max_workers, model, angles,
+                  per_request):
+    parallel = (
+        len(algorithms) > 1
+        and len(requests) >= PARALLEL_THRESHOLD
+        and (max_workers is None or max_workers > 1)
+    )
+    if not parallel:
+        for algo in algorithms:
+            yield algo, run_algorithm(algo, requests, head, direction, disk_size, model, angles,
+                                      per_request)
+        return
+
+    workers = min(len(algorithms), max_workers or multiprocessing.cpu_count())
+
+    # A mapped trace is already shared through the page cache; workers map
+    # the same file instead of copying it anywhere.
+    trace_path = getattr(requests, "trace_path", None)
+    if trace_path is not None:
+        tasks = [(_run_mapped, trace_path, algo, get_scheduler(algo), head, direction, disk_size,
+                  model, per_request)
+                 for algo in algorithms]
+        yield from _run_pool(tasks, workers)
+        return
+
+    # The request array is copied into shared memory once; every worker
+    # attaches to it by name instead of receiving its own pickled copy.
+    shm = shared_memory.SharedMemory(create=True, size=len(requests) * 8)
+    try:
+        view = shm.buf[:len(requests) * 8].cast("q")
+        view[:] = array("q", requests)
+        view.release()
+
+        tasks = [
+            (_run_shared, shm.name, len(requests), algo, get_scheduler(algo), head, direction,
+             disk_size, model, angles, per_request)
+            for algo in algorithms
+        ]
+        yield from _run_pool(tasks, workers)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def compare(requests, head, algorithms, direction="right", disk_size=200, max_workers=None,
+            cache=None, model=None, angles=None, per_request=False):
+    results = dict(iter_compare(requests, head, algorithms, direction, disk_size, max_workers,
+                                cache, model, angles, per_request))
+    return {algo: results[algo] for algo in algorithms}
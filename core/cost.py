@@ -0,0 +1,192 @@
+import csv
+import math
+from bisect import bisect_right
+
+# Seek curves map arrays of track distances to milliseconds. A drive model
+# adds the rotational latency and transfer time every request pays on top.
+# Curves with a scalar() method also time one distance in plain Python, so
+# short paths never import NumPy.
+
+# Below this many distances plain Python is quicker than importing NumPy
+NUMPY_THRESHOLD = 10_000
+
+
+class LinearSeek:
+    """Seek time proportional to distance, plus a settle time for any move."""
+
+    def __init__(self, ms_per_track=0.01, settle_ms=0.0):
+        self.ms_per_track = ms_per_track
+        self.settle_ms = settle_ms
+
+    def __call__(self, distances):
+        import numpy as np
+
+        distances = np.asarray(distances, dtype=float)
+        return np.where(distances > 0, self.settle_ms + self.ms_per_track * distances, 0.0)
+
+    def scalar(self, distance):
+        return self.settle_ms + self.ms_per_track * distance if distance > 0 else 0.0
+
+    def __repr__(self):
+        return f"LinearSeek({self.ms_per_track!r}, {self.settle_ms!r})"
+
+
+class SqrtSeek:
+    """The classic seek curve: settle + coefficient * sqrt(distance).
+
+    Short seeks are dominated by the arm accelerating and decelerating, so
+    time grows with the square root of the distance rather than linearly.
+    """
+
+    def __init__(self, ms_per_sqrt_track=0.3, settle_ms=1.0):
+        self.ms_per_sqrt_track = ms_per_sqrt_track
+        self.settle_ms = settle_ms
+
+    def __call__(self, distances):
+        import numpy as np
+
+        distances = np.asarray(distances, dtype=float)
+        return np.where(distances > 0,
+                        self.settle_ms + self.ms_per_sqrt_track * np.sqrt(distances), 0.0)
+
+    def scalar(self, distance):
+        if distance <= 0:
+            return 0.0
+        return self.settle_ms + self.ms_per_sqrt_track * math.sqrt(distance)
+
+    def __repr__(self):
+        return f"SqrtSeek({self.ms_per_sqrt_track!r}, {self.settle_ms!r})"
+
+
+class TableSeek:
+    """Seek times measured on a real drive, interpolated linearly between points."""
+
+    def __init__(self, distances, times_ms):
+        points = sorted(zip(map(float, distances), map(float, times_ms)), key=lambda p: p[0])
+        if not points:
+            raise ValueError("A seek table needs at least one point")
+        self.distances = [distance for distance, _ in points]
+        self.times_ms = [ms for _, ms in points]
+
+    @classmethod
+    def from_csv(cls, path):
+        """Load a profile of 'distance,ms' rows; a header row is skipped."""
+        distances = []
+        times = []
+        with open(path, newline="") as f:
+            for row in csv.reader(f):
+                if not row:
+                    continue
+                try:
+                    distance, ms = float(row[0]), float(row[1])
+                except (ValueError, IndexError):
+                    if distances:
+                        raise ValueError(f"Bad seek profile row: {row}") from None
+                    continue
+                distances.append(distance)
+                times.append(ms)
+        return cls(distances, times)
+
+    def __call__(self, distances):
+        import numpy as np
+
+        distances = np.asarray(distances, dtype=float)
+        return np.where(distances > 0, np.interp(distances, self.distances, self.times_ms), 0.0)
+
+    def scalar(self, distance):
+        # The same interpolation as numpy.interp, clamped at both ends
+        if distance <= 0:
+            return 0.0
+        i = bisect_right(self.distances, distance)
+        if i == 0:
+            return self.times_ms[0]
+        if i == len(self.distances):
+            return self.times_ms[-1]
+        x0, x1 = self.distances[i - 1], self.distances[i]
+        y0, y1 = self.times_ms[i - 1], self.times_ms[i]
+        return (y1 - y0) / (x1 - x0) * (distance - x0) + y0
+
+    def __repr__(self):
+        return f"TableSeek({self.distances!r}, {self.times_ms!r})"
+
+
+SEEK_CURVES = {
+    "linear": LinearSeek,
+    "sqrt": SqrtSeek,
+}
+
+
+class DriveModel:
+    """Service time of each request: seek + rotational latency + transfer.
+
+    Rotational latency is the average half revolution at `rpm` (0 for a
+    device without a platter); transfer_ms is paid once per request.
+    """
+
+    def __init__(self, seek=None, rpm=7200, transfer_ms=0.0):
+        self.seek = seek if seek is not None else SqrtSeek()
+        self.rpm = rpm
+        self.transfer_ms = transfer_ms
+
+    @property
+    def rotational_ms(self):
+        return 30_000 / self.rpm if self.rpm else 0.0
+
+    def seek_list(self, distances):
+        """Milliseconds to seek each of `distances` tracks, as a list of floats."""
+        if len(distances) < NUMPY_THRESHOLD and hasattr(self.seek, "scalar"):
+            return [self.seek.scalar(distance) for distance in distances]
+        return self.seek(distances).tolist()
+
+    def seek_times(self, sequence, head):
+        """Milliseconds spent seeking to each position of a head path."""
+        import numpy as np
+
+        path = np.empty(len(sequence) + 1, dtype=float)
+        path[0] = head
+        path[1:] = sequence
+        return self.seek(np.abs(np.diff(path)))
+
+    def request_times(self, sequence, head):
+        """Milliseconds spent on each request of a service sequence."""
+        return self.seek_times(sequence, head) + (self.rotational_ms + self.transfer_ms)
+
+    def service_time(self, distance):
+        """Milliseconds for one request reached after moving `distance` tracks."""
+        seek = self.seek.scalar(distance) if hasattr(self.seek, "scalar") else self.seek(distance)
+        return float(seek) + self.rotational_ms + self.transfer_ms
+
+    def total_time(self, sequence, head, num_requests=None):
+        """Total milliseconds for a head path serving num_requests requests.
+
+        num_requests defaults to the length of the path; SCAN-style paths
+        that also visit the disk edges pass the real count so the turns are
+        charged for the seek only. Short paths are timed in plain Python.
+        """
+        if num_requests is None:
+            num_requests = len(sequence)
+        if len(sequence) < NUMPY_THRESHOLD and hasattr(self.seek, "scalar"):
+            seek = 0.0
+            for track in sequence:
+                seek += self.seek.scalar(abs(track - head))
+                head = track
+        else:
+            seek = float(self.seek_times(sequence, head).sum())
+        return seek + num_requests * (self.rotational_ms + self.transfer_ms)
+
+    def evaluate(self, sequence, head, num_requests=None):
+        """Return (total_ms, iops) for a service sequence starting at head."""
+        if num_requests is None:
+            num_requests = len(sequence)
+        total_ms = self.total_time(sequence, head, num_requests)
+        return total_ms, iops(num_requests, total_ms)
+
+    def __repr__(self):
+        return f"DriveModel({self.seek!r}, {self.rpm!r}, {self.transfer_ms!r})"
+
+
+def iops(num_requests, total_ms):
+    return num_requests * 1000 / total_ms if total_ms else 0
+
+
+DEFAULT_MODEL = DriveModel()
@@ -1,7 +1,9 @@
-def cscan(requests, head, direction="right", disk_size=200):
+def cscan(requests, head, direction="right", disk_size=200, assume_sorted=False, edges=None):
+    """edges, when given a list, gets the index of every disk-edge point
+    added to the sequence; those positions serve no request."""
     total_seek_time = 0
     sequence = []
-    requests_sorted = sorted(requests)
+    requests_sorted = requests if assume_sorted else sorted(requests)
 
     if direction == "right":
         right = [r for r in requests_sorted if r >= head]
@@ -47,4 +49,8 @@ def cscan(requests, head, direction="right", disk_size=200):
             sequence.append(r)
             head = r
 
+    if edges is not None:
+        # Edge points sit between the first pass and the second
+        first_pass = len(right) if direction == "right" else len(left)
+        edges.extend(range(first_pass, first_pass + len(sequence) - len(requests_sorted)))
     return sequence, total_seek_time
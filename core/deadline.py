@@ -0,0 +1,124 @@
+from collections import deque
+
+from core.sortedlist import SortedList
+
+# Defaults of Linux mq-deadline. Expiry times are in the simulation's time
+# unit, which is milliseconds when a drive model is used.
+READ_EXPIRE = 500
+WRITE_EXPIRE = 5000
+FIFO_BATCH = 16
+WRITES_STARVED = 2
+
+READ = 0
+WRITE = 1
+
+
+class DeadlinePolicy:
+    """mq-deadline: a sector-sorted queue and a FIFO with expiry per direction.
+
+    Requests are dispatched in batches of up to fifo_batch, walking one
+    direction's sorted queue upwards from the last dispatched sector. A new
+    batch prefers reads, but hands over to writes once they have been passed
+    over writes_starved times, and starts from the oldest request of its
+    direction when that one has expired or the sorted walk has run out.
+
+    Unlike the other policies, add() takes the request type and the current
+    time and pop() takes the current time; simulate() passes both because
+    `timed` is set.
+    """
+
+    timed = True
+
+    def __init__(self, head, direction="right", disk_size=200, read_expire=READ_EXPIRE,
+                 write_expire=WRITE_EXPIRE, fifo_batch=FIFO_BATCH, writes_starved=WRITES_STARVED):
+        self.head = head
+        self.expire = (read_expire, write_expire)
+        self.fifo_batch = fifo_batch
+        self.writes_starved = writes_starved
+        self.sorted = (SortedList(), SortedList())  # (track, rid)
+        self.fifo = (deque(), deque())              # (deadline, rid, track), oldest first
+        self.deadlines = {}  # rid -> deadline, for requests not yet dispatched
+        self.last = [(head, -1), (head, -1)]
+        self.batch_dir = None
+        self.batching = 0
+        self.starved = 0
+        self.deadline_misses = 0
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def add(self, track, rid, write=False, now=0.0):
+        data_dir = WRITE if write else READ
+        deadline = now + self.expire[data_dir]
+        self.sorted[data_dir].add((track, rid))
+        self.fifo[data_dir].append((deadline, rid, track))
+        self.deadlines[rid] = deadline
+
+    def _oldest(self, data_dir):
+        # Entries dispatched through the sorted queue are dropped lazily
+        fifo = self.fifo[data_dir]
+        while fifo[0][1] not in self.deadlines:
+            fifo.popleft()
+        return fifo[0]
+
+    def _next_sorted(self, data_dir):
+        return self.sorted[data_dir].ceiling(self.last[data_dir])
+
+    def pop(self, now=0.0):
+        request = None
+        if self.batch_dir is not None and self.batching < self.fifo_batch:
+            request = self._next_sorted(self.batch_dir)
+            data_dir = self.batch_dir
+
+        if request is None:
+            reads, writes = self.sorted
+            if reads and not (writes and self._count_starved()):
+                data_dir = READ
+            else:
+                data_dir = WRITE
+                self.starved = 0
+            deadline, rid, track = self._oldest(data_dir)
+            request = self._next_sorted(data_dir)
+            if request is None or deadline <= now:
+                request = (track, rid)
+            self.batch_dir = data_dir
+            self.batching = 0
+
+        track, rid = request
+        self.sorted[data_dir].remove(request)
+        if now > self.deadlines.pop(rid):
+            self.deadline_misses += 1
+        self.batching += 1
+        self.last[data_dir] = request
+
+        distance = abs(self.head - track)
+        self.head = track
+        return track, rid, distance
+
+    def _count_starved(self):
+        # True once writes have been passed over writes_starved times
+        starved = self.starved >= self.writes_starved
+        self.starved += 1
+        return starved
+
+
+def deadline(requests, head, writes=None, read_expire=READ_EXPIRE, write_expire=WRITE_EXPIRE,
+             fifo_batch=FIFO_BATCH, writes_starved=WRITES_STARVED):
+    """Run DeadlinePolicy over a static queue where every request arrives at time 0.
+
+    Time advances by one unit per track moved, so expiry times count tracks
+    here. writes optionally flags each request as a write; by default all are
+    reads. Returns (sequence, total_seek_time, deadline_misses).
+    """
+    policy = DeadlinePolicy(head, read_expire=read_expire, write_expire=write_expire,
+                            fifo_batch=fifo_batch, writes_starved=writes_starved)
+    for rid, track in enumerate(requests):
+        policy.add(track, rid, writes[rid] if writes is not None else False)
+
+    now = 0
+    sequence = []
+    while policy:
+        track, _, distance = policy.pop(now)
+        now += distance
+        sequence.append(track)
+    return sequence, now, policy.deadline_misses
@@ -0,0 +1,133 @@
+from array import array
+from heapq import heappop, heappush
+
+from core.deadline import DeadlinePolicy
+from core.metrics import percentiles
+from core.online import SCHEDULERS
+
+# Event kinds. Arrivals sort before completions at the same instant so a
+# request that lands exactly when the head frees up is already queued.
+ARRIVAL = 0
+COMPLETION = 1
+
+POLICIES = {**SCHEDULERS, "DEADLINE": DeadlinePolicy}
+
+
+class SimulationResult:
+    __slots__ = ("sequence", "total_seek_time", "arrival", "wait", "response", "makespan",
+                 "deadline_misses")
+
+    def __init__(self, sequence, total_seek_time, arrival, wait, response, makespan,
+                 deadline_misses=None):
+        self.sequence = sequence
+        self.total_seek_time = total_seek_time
+        self.arrival = arrival
+        self.wait = wait
+        self.response = response
+        self.makespan = makespan
+        # Only set for policies with deadlines, such as DeadlinePolicy
+        self.deadline_misses = deadline_misses
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def latency_percentiles(self, qs=(50, 95, 99)):
+        return percentiles(self.response, qs)
+
+    def summary(self):
+        count = len(self.arrival)
+        response = self.latency_percentiles()
+        summary = {
+            "requests": count,
+            "total_seek_time": self.total_seek_time,
+            "makespan": self.makespan,
+            "average_wait": sum(self.wait) / count if count else 0,
+            "average_response": sum(self.response) / count if count else 0,
+            "max_wait": max(self.wait, default=0),
+            "p50": response[50],
+            "p95": response[95],
+            "p99": response[99],
+        }
+        if self.deadline_misses is not None:
+            summary["deadline_misses"] = self.deadline_misses
+        return summary
+
+
+def simulate(arrivals, head, policy="FCFS", direction="right", disk_size=200,
+             track_time=1.0, service_time=0.0, model=None):
+    """Serve a stream of (arrival_time, track) pairs sorted by arrival time.
+
+    Items may carry a third field that is true for writes; only policies
+    with `timed` set (DEADLINE) use it, receiving the request type and the
+    current time in add() and the current time in pop().
+
+    policy is a name from POLICIES or an object with add(), pop() and
+    __len__() like the classes above. Moving one track takes track_time and
+    every request then takes service_time to transfer. With a DriveModel from
+    core.cost, service times come from the model instead, in milliseconds.
+    """
+    if isinstance(policy, str):
+        policy = POLICIES[policy](head, direction, disk_size)
+    timed = getattr(policy, "timed", False)
+
+    arrival = array("d")
+    wait = array("d")
+    response = array("d")
+    sequence = array("q")
+    total_seek_time = 0
+    busy = False
+    now = 0.0
+    # Distances are bounded by the disk size, so each is modeled only once
+    durations = {}
+
+    # Arrivals are pulled from the stream one at a time, so the event heap
+    # holds at most the next arrival and the request in service.
+    stream = iter(arrivals)
+    events = []
+    first = next(stream, None)
+    if first is not None:
+        heappush(events, (first[0], ARRIVAL, 0, first[1], len(first) > 2 and first[2]))
+    next_rid = 1
+
+    while events:
+        now, kind, rid, track, write = heappop(events)
+
+        if kind == ARRIVAL:
+            arrival.append(now)
+            wait.append(0.0)
+            response.append(0.0)
+            if timed:
+                policy.add(track, rid, write, now)
+            else:
+                policy.add(track, rid)
+
+            item = next(stream, None)
+            if item is not None:
+                if item[0] < now:
+                    raise ValueError("Arrivals must be sorted by arrival time")
+                heappush(events, (item[0], ARRIVAL, next_rid, item[1], len(item) > 2 and item[2]))
+                next_rid += 1
+        else:
+            response[rid] = now - arrival[rid]
+            busy = False
+
+        # Let every arrival at this instant join the queue before deciding
+        if events and events[0][0] == now and events[0][1] == ARRIVAL:
+            continue
+
+        if not busy and policy:
+            track, rid, distance = policy.pop(now) if timed else policy.pop()
+            total_seek_time += distance
+            sequence.append(track)
+            wait[rid] = now - arrival[rid]
+            if model is None:
+                duration = distance * track_time + service_time
+            else:
+                duration = durations.get(distance)
+                if duration is None:
+                    duration = durations[distance] = model.service_time(distance)
+            heappush(events, (now + duration, COMPLETION, rid, track, False))
+            busy = True
+
+    return SimulationResult(sequence, total_seek_time, arrival, wait, response, now,
+                            getattr(policy, "deadline_misses", None))
@@ -1,7 +1,7 @@
-def look(requests, head, direction="right", disk_size=200):
+def look(requests, head, direction="right", disk_size=200, assume_sorted=False):
     total_seek_time = 0
     sequence = []
-    requests_sorted = sorted(requests)
+    requests_sorted = requests if assume_sorted else sorted(requests)
 
     if direction == "right":
         right = [r for r in requests_sorted if r >= head]
@@ -0,0 +1,176 @@
+from core.cost import NUMPY_THRESHOLD
+
+
+def seek_metrics(num_requests, total_seek_time):
+    average_seek_time = total_seek_time / num_requests if num_requests else 0
+    throughput = num_requests / total_seek_time if total_seek_time != 0 else 0
+    return average_seek_time, throughput
+
+
+def percentiles(values, qs=(50, 95, 99)):
+    # Linear interpolation between closest ranks, as numpy.percentile does
+    ordered = sorted(values)
+    if not ordered:
+        return {q: 0 for q in qs}
+    result = {}
+    for q in qs:
+        position = (len(ordered) - 1) * q / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        result[q] = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+    return result
+
+
+def service_positions(requests, sequence, edges=None):
+    """Index into sequence at which each request is served.
+
+    requests is the queue in arrival order and sequence the service order
+    returned by a scheduler. Repeated tracks are matched first-come
+    first-served. edges lists the positions in the sequence that are not
+    requests (the disk edges SCAN turns at, as reported by the scheduler);
+    they are never matched, even when a request sits on the same track.
+    Returns a NumPy array aligned with requests; a request that never
+    appears in sequence gets -1.
+    """
+    import numpy as np
+
+    requests = np.asarray(requests, dtype=np.int64)
+    sequence = np.asarray(sequence, dtype=np.int64)
+    served_at = np.arange(len(sequence))
+    if edges is not None and len(edges):
+        served_at = np.delete(served_at, edges)
+        sequence = sequence[served_at]
+
+    by_track = np.argsort(requests, kind="stable")
+    requests_sorted = requests[by_track]
+    order = np.argsort(sequence, kind="stable")
+    sequence_sorted = sequence[order]
+
+    # k-th visit to a track serves the k-th request on it, if there is one
+    rank = np.arange(len(sequence)) - np.searchsorted(sequence_sorted, sequence_sorted)
+    first = np.searchsorted(requests_sorted, sequence_sorted)
+    count = np.searchsorted(requests_sorted, sequence_sorted, side="right") - first
+    served = rank < count
+
+    positions = np.full(len(requests), -1, dtype=np.int64)
+    positions[by_track[(first + rank)[served]]] = served_at[order[served]]
+    return positions
+
+
+def service_delays(requests, sequence, edges=None):
+    """How many places later than arrival order each request was served.
+
+    Matching follows service_positions(). Returns a NumPy array aligned with
+    requests; FCFS gives all zeros, negative values were served early.
+    """
+    import numpy as np
+
+    positions = service_positions(requests, sequence, edges)
+    matched = np.flatnonzero(positions >= 0)
+    service_rank = np.empty(len(matched), dtype=np.int64)
+    service_rank[np.argsort(positions[matched])] = np.arange(len(matched))
+
+    delays = np.zeros(len(positions), dtype=np.int64)
+    delays[matched] = service_rank - matched
+    return delays
+
+
+def max_delay(requests, sequence, edges=None):
+    """Largest of service_delays(), never below 0; short inputs stay in plain Python."""
+    if len(sequence) >= NUMPY_THRESHOLD:
+        return int(service_delays(requests, sequence, edges).max(initial=0))
+
+    arrivals = {}
+    for index, track in enumerate(requests):
+        arrivals.setdefault(track, []).append(index)
+    skip = set(edges or ())
+    visits = {}
+    rank = 0
+    delay = 0
+    for position, track in enumerate(sequence):
+        waiting = arrivals.get(track)
+        if position in skip or waiting is None:
+            continue
+        # k-th visit to a track serves the k-th request on it, if there is one
+        k = visits.get(track, 0)
+        if k < len(waiting):
+            visits[track] = k + 1
+            delay = max(delay, rank - waiting[k])
+            rank += 1
+    return delay
+
+
+HISTOGRAM_BINS = 10
+TAIL_PERCENTILES = (50, 90, 99)
+
+
+def jain_fairness(values):
+    """Jain's index: 1.0 when every value is equal, down to 1/n when one
+    request takes everything."""
+    import numpy as np
+
+    values = np.asarray(values, dtype=float)
+    square_sum = float(np.dot(values, values))
+    if not square_sum:
+        return 1.0
+    return float(values.sum()) ** 2 / (len(values) * square_sum)
+
+
+class RequestMetrics:
+    """Per-request results of one scheduler run, in arrival order.
+
+    positions is where each request falls in the service sequence, seeks the
+    tracks moved to reach it and waits the tracks the head moved in total
+    before reaching it (every request of a static queue arrives at time 0).
+    """
+
+    __slots__ = ("positions", "seeks", "waits")
+
+    def __init__(self, positions, seeks, waits):
+        self.positions = positions
+        self.seeks = seeks
+        self.waits = waits
+
+    @classmethod
+    def from_sequence(cls, requests, sequence, head, edges=None):
+        import numpy as np
+
+        path = np.empty(len(sequence) + 1, dtype=np.int64)
+        path[0] = head
+        path[1:] = sequence
+        steps = np.abs(np.diff(path))
+        positions = service_positions(requests, sequence, edges)
+        return cls(positions.astype(np.int32), steps[positions].astype(np.int32),
+                   np.cumsum(steps)[positions])
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def nbytes(self):
+        return self.positions.nbytes + self.seeks.nbytes + self.waits.nbytes
+
+    def histogram(self, bins=HISTOGRAM_BINS):
+        """(counts, edges) of the seek distances over `bins` equal integer-width bins."""
+        import numpy as np
+
+        width = max(1, -(-(int(self.seeks.max(initial=0)) + 1) // bins))
+        counts = np.bincount(self.seeks // width, minlength=bins)
+        return counts.tolist(), (np.arange(bins + 1) * width).tolist()
+
+    def summary(self, bins=HISTOGRAM_BINS):
+        """Tail percentiles, variance and fairness of seeks and waits as plain numbers."""
+        import numpy as np
+
+        result = {}
+        for name, values in (("seek", self.seeks), ("wait", self.waits)):
+            tails = (np.percentile(values, TAIL_PERCENTILES).tolist() if len(values)
+                     else [0.0] * len(TAIL_PERCENTILES))
+            for q, value in zip(TAIL_PERCENTILES, tails):
+                result[f"{name}_p{q}"] = value
+            result[f"{name}_max"] = int(values.max(initial=0))
+            result[f"{name}_variance"] = float(values.var()) if len(values) else 0.0
+        result["fairness"] = jain_fairness(self.waits)
+        counts, edges = self.histogram(bins)
+        result["seek_histogram"] = {"edges": edges, "counts": counts}
+        return result
@@ -0,0 +1,41 @@
+from core.scan import scan
+
+DEFAULT_N = 10
+
+
+def nstep_scan(requests, head, n=DEFAULT_N, direction="right", disk_size=200, edges=None):
+    """N-Step SCAN: split the queue, in arrival order, into batches of n.
+
+    Each batch is frozen and served by one SCAN pass from wherever the last
+    one left the head, so a request can only be overtaken by requests from
+    its own batch. edges collects the disk-edge points as in core.scan.scan.
+    """
+    if n < 1:
+        raise ValueError("N-Step SCAN needs a batch size of at least 1")
+    total_seek_time = 0
+    sequence = []
+    for start in range(0, len(requests), n):
+        batch_edges = None if edges is None else []
+        batch_sequence, seek = scan(requests[start:start + n], head, direction, disk_size,
+                                    edges=batch_edges)
+        if edges is not None:
+            edges.extend(len(sequence) + i for i in batch_edges)
+        total_seek_time += seek
+        sequence.extend(batch_sequence)
+        # Keep sweeping the way the arm was last moving
+        last = batch_sequence[-1]
+        before = batch_sequence[-2] if len(batch_sequence) > 1 else head
+        if last != before:
+            direction = "right" if last > before else "left"
+        head = last
+    return sequence, total_seek_time
+
+
+def fscan(requests, head, direction="right", disk_size=200, edges=None):
+    """FSCAN on a static queue.
+
+    FSCAN freezes whatever is queued when a sweep starts; with every request
+    already queued that is a single batch, i.e. plain SCAN. The difference
+    only shows with timed arrivals (event_sim.FSCANPolicy).
+    """
+    return nstep_scan(requests, head, max(len(requests), 1), direction, disk_size, edges)
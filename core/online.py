@@ -0,0 +1,237 @@
+from collections import deque
+from heapq import heappop, heappush
+
+from core.nstep import DEFAULT_N
+
+
+class OnlineScheduler:
+    """Incremental interface shared by the policies below.
+
+    submit() queues a track and returns its request id, next() dispatches
+    the request the policy would serve now and returns its track (None when
+    idle), and pending() counts queued requests. FCFS keeps a deque (O(1)
+    per call); SSTF and the sweep policies keep heaps (O(log n) per call).
+    N-STEP-SCAN and FSCAN queue arrivals in a deque and move a whole batch
+    into a SCAN policy when the previous one is done, so one next() costs
+    O(k log k) for a batch of k, O(log k) per request amortized.
+    total_seek_time accumulates the distance moved by next().
+    """
+
+    submitted = 0
+    total_seek_time = 0
+
+    def submit(self, track):
+        rid = self.submitted
+        self.submitted = rid + 1
+        self.add(track, rid)
+        return rid
+
+    def next(self):
+        if not self:
+            return None
+        track, _, distance = self.pop()
+        self.total_seek_time += distance
+        return track
+
+    def pending(self):
+        return len(self)
+
+
+# Queueing policies. Each one tracks the head itself; add() queues a request
+# with a caller-chosen id and pop() returns (track, request_id, seek_distance)
+# for the next one to serve. Distances follow the same rules as the static
+# functions in core/.
+
+class FCFSPolicy(OnlineScheduler):
+    def __init__(self, head, direction="right", disk_size=200):
+        self.head = head
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, track, rid):
+        self.queue.append((track, rid))
+
+    def pop(self):
+        track, rid = self.queue.popleft()
+        distance = abs(self.head - track)
+        self.head = track
+        return track, rid, distance
+
+
+class SSTFPolicy(OnlineScheduler):
+    def __init__(self, head, direction="right", disk_size=200):
+        self.head = head
+        self.up = []    # (track, rid) for tracks >= head
+        self.down = []  # (-track, rid) for tracks < head
+
+    def __len__(self):
+        return len(self.up) + len(self.down)
+
+    def add(self, track, rid):
+        if track >= self.head:
+            heappush(self.up, (track, rid))
+        else:
+            heappush(self.down, (-track, rid))
+
+    def pop(self):
+        take_down = bool(self.down)
+        if take_down and self.up:
+            down_seek = self.head + self.down[0][0]
+            up_seek = self.up[0][0] - self.head
+            # Equal distance goes to whichever request arrived first
+            take_down = down_seek < up_seek or (
+                down_seek == up_seek and self.down[0][1] < self.up[0][1])
+
+        if take_down:
+            key, rid = heappop(self.down)
+            track = -key
+        else:
+            track, rid = heappop(self.up)
+
+        distance = abs(self.head - track)
+        self.head = track
+        return track, rid, distance
+
+
+class LOOKPolicy(OnlineScheduler):
+    travel_to_end = False
+
+    def __init__(self, head, direction="right", disk_size=200):
+        self.head = head
+        self.direction = direction
+        self.disk_size = disk_size
+        self.up = []    # (track, rid) for tracks ahead when moving right
+        self.down = []  # (-track, rid) for tracks ahead when moving left
+
+    def __len__(self):
+        return len(self.up) + len(self.down)
+
+    def add(self, track, rid):
+        if track > self.head or (track == self.head and self.direction == "right"):
+            heappush(self.up, (track, rid))
+        else:
+            heappush(self.down, (-track, rid))
+
+    def pop(self):
+        distance = 0
+        if self.direction == "right" and not self.up:
+            self.direction = "left"
+            if self.travel_to_end:
+                distance += abs(self.disk_size - 1 - self.head)
+                self.head = self.disk_size - 1
+        elif self.direction == "left" and not self.down:
+            self.direction = "right"
+            if self.travel_to_end:
+                distance += abs(self.head)
+                self.head = 0
+
+        if self.direction == "right":
+            track, rid = heappop(self.up)
+        else:
+            key, rid = heappop(self.down)
+            track = -key
+
+        distance += abs(self.head - track)
+        self.head = track
+        return track, rid, distance
+
+
+class SCANPolicy(LOOKPolicy):
+    travel_to_end = True
+
+
+class CLOOKPolicy(OnlineScheduler):
+    travel_to_end = False
+
+    def __init__(self, head, direction="right", disk_size=200):
+        self.head = head
+        self.disk_size = disk_size
+        # Keys are tracks multiplied by the sweep sign, so both directions
+        # use min-heaps ordered along the sweep.
+        self.sign = 1 if direction == "right" else -1
+        self.current = []  # ahead of the head in this sweep
+        self.later = []    # behind the head, served after wrapping around
+
+    def __len__(self):
+        return len(self.current) + len(self.later)
+
+    def add(self, track, rid):
+        key = self.sign * track
+        if key >= self.sign * self.head:
+            heappush(self.current, (key, rid))
+        else:
+            heappush(self.later, (key, rid))
+
+    def pop(self):
+        distance = 0
+        if not self.current:
+            self.current, self.later = self.later, []
+            if self.travel_to_end:
+                end, start = (self.disk_size - 1, 0) if self.sign == 1 else (0, self.disk_size - 1)
+                distance += abs(self.head - end) + self.disk_size - 1
+                self.head = start
+
+        key, rid = heappop(self.current)
+        track = self.sign * key
+        distance += abs(self.head - track)
+        self.head = track
+        return track, rid, distance
+
+
+class CSCANPolicy(CLOOKPolicy):
+    travel_to_end = True
+
+
+class NStepSCANPolicy(OnlineScheduler):
+    """SCAN over frozen batches of at most n requests, taken in arrival order.
+
+    Requests arriving while a batch is served wait for a later one, so new
+    requests near the head cannot hold back the ones already batched.
+    """
+
+    def __init__(self, head, direction="right", disk_size=200, n=DEFAULT_N):
+        self.n = n
+        self.scan = SCANPolicy(head, direction, disk_size)
+        self.waiting = deque()
+
+    def __len__(self):
+        return len(self.scan) + len(self.waiting)
+
+    def add(self, track, rid):
+        self.waiting.append((track, rid))
+
+    def pop(self):
+        if not self.scan:
+            count = len(self.waiting) if self.n is None else min(self.n, len(self.waiting))
+            for _ in range(count):
+                self.scan.add(*self.waiting.popleft())
+        return self.scan.pop()
+
+
+class FSCANPolicy(NStepSCANPolicy):
+    """Freeze everything queued when a sweep starts; later arrivals wait for the next."""
+
+    def __init__(self, head, direction="right", disk_size=200):
+        super().__init__(head, direction, disk_size, n=None)
+
+
+SCHEDULERS = {
+    "FCFS": FCFSPolicy,
+    "SSTF": SSTFPolicy,
+    "SCAN": SCANPolicy,
+    "C-SCAN": CSCANPolicy,
+    "LOOK": LOOKPolicy,
+    "C-LOOK": CLOOKPolicy,
+    "N-STEP-SCAN": NStepSCANPolicy,
+    "FSCAN": FSCANPolicy,
+}
+
+
+def online_scheduler(name, head, direction="right", disk_size=200):
+    """Create an empty incremental scheduler, e.g. online_scheduler("LOOK", 53)."""
+    try:
+        return SCHEDULERS[name.upper()](head, direction, disk_size)
+    except KeyError:
+        raise ValueError(f"No online scheduler named {name!r}") from None
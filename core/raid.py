@@ -0,0 +1,216 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from core.compare import PARALLEL_THRESHOLD, run_algorithm
+from core.registry import get_scheduler
+from core.result import ScheduleResult
+
+# Logical tracks are striped over the member disks in units of `stripe`
+# tracks. Every member has disk_size tracks and starts with its head at the
+# same position.
+LAYOUTS = ("RAID-0", "RAID-1", "RAID-5", "RAID-10")
+MIN_DISKS = {"RAID-0": 1, "RAID-1": 2, "RAID-5": 3, "RAID-10": 4}
+DEFAULT_STRIPE = 8
+
+
+def _check_layout(layout, disks):
+    if layout not in MIN_DISKS:
+        raise ValueError(f"Unknown layout {layout!r} (choose from {', '.join(LAYOUTS)})")
+    if disks < MIN_DISKS[layout]:
+        raise ValueError(f"{layout} needs at least {MIN_DISKS[layout]} disks")
+    if layout == "RAID-10" and disks % 2:
+        raise ValueError("RAID-10 needs an even number of disks")
+
+
+def capacity(layout, disks, disk_size, stripe=DEFAULT_STRIPE):
+    """Number of logical tracks the array exposes."""
+    _check_layout(layout, disks)
+    if layout == "RAID-1":
+        return disk_size
+    data_disks = {"RAID-0": disks, "RAID-5": disks - 1, "RAID-10": disks // 2}[layout]
+    # A partial stripe unit at the end of each member is left unused
+    return disk_size // stripe * stripe * data_disks
+
+
+def map_requests(requests, layout, disks, disk_size, stripe=DEFAULT_STRIPE, writes=None):
+    """Split logical requests into one queue of member tracks per disk.
+
+    Each queue keeps arrival order. Mirrored layouts send reads to the
+    mirrors in turn and writes to every mirror; RAID-5 writes also update
+    the parity disk of their stripe (left-asymmetric rotating parity).
+    """
+    # Imported here; cli.py reads LAYOUTS from this module on every run
+    import numpy as np
+
+    _check_layout(layout, disks)
+    lba = np.asarray(requests, dtype=np.int64)
+    if len(lba) and (lba.min() < 0 or lba.max() >= capacity(layout, disks, disk_size, stripe)):
+        raise ValueError(f"All requests must be between 0 and "
+                         f"{capacity(layout, disks, disk_size, stripe) - 1} for this array")
+    index = np.arange(len(lba))
+    writes = np.zeros(len(lba), dtype=bool) if writes is None else np.asarray(writes, dtype=bool)
+    chunk, offset = np.divmod(lba, stripe)
+    # Pieces of (request index, disk, track); concatenated and grouped below
+    pieces = []
+
+    if layout == "RAID-0":
+        pieces.append((index, chunk % disks, chunk // disks * stripe + offset))
+    elif layout == "RAID-1":
+        pieces.append((index[~writes], index[~writes] % disks, lba[~writes]))
+        for disk in range(disks):
+            pieces.append((index[writes], np.full(writes.sum(), disk), lba[writes]))
+    elif layout == "RAID-10":
+        pairs = disks // 2
+        pair = chunk % pairs
+        track = chunk // pairs * stripe + offset
+        reads = ~writes
+        pieces.append((index[reads], 2 * pair[reads] + index[reads] % 2, track[reads]))
+        for side in (0, 1):
+            pieces.append((index[writes], 2 * pair[writes] + side, track[writes]))
+    else:
+        row, column = np.divmod(chunk, disks - 1)
+        parity = disks - 1 - row % disks
+        track = row * stripe + offset
+        pieces.append((index, column + (column >= parity), track))
+        pieces.append((index[writes], parity[writes], track[writes]))
+
+    order_index = np.concatenate([piece[0] for piece in pieces])
+    disk = np.concatenate([piece[1] for piece in pieces])
+    track = np.concatenate([piece[2] for piece in pieces])
+    order = np.lexsort((order_index, disk))
+    bounds = np.searchsorted(disk[order], np.arange(disks + 1))
+    track = track[order]
+    return [track[bounds[i]:bounds[i + 1]] for i in range(disks)]
+
+
+class ArrayResult:
+    """Per-member results of one algorithm on an array, plus aggregates.
+
+    members holds one run_algorithm() ScheduleResult per disk and queue_sizes the
+    number of member requests each disk received. Members work in parallel,
+    so the array finishes when its busiest disk does.
+    """
+
+    __slots__ = ("layout", "requests", "members", "queue_sizes")
+
+    def __init__(self, layout, requests, members, queue_sizes):
+        self.layout = layout
+        self.requests = requests
+        self.members = members
+        self.queue_sizes = queue_sizes
+
+    @property
+    def total_seek_time(self):
+        return sum(member.total_seek_time for member in self.members)
+
+    @property
+    def makespan_ms(self):
+        return max((member.total_ms for member in self.members), default=0.0)
+
+    @property
+    def iops(self):
+        return self.requests * 1000 / self.makespan_ms if self.makespan_ms else 0
+
+    @property
+    def hot_disk(self):
+        times = [member.total_ms for member in self.members]
+        return times.index(max(times))
+
+    @property
+    def imbalance(self):
+        """Busiest member's time over the mean; 1.0 means perfectly balanced."""
+        mean = sum(member.total_ms for member in self.members) / len(self.members)
+        return self.makespan_ms / mean if mean else 1.0
+
+    def disk_rows(self):
+        """One dict per member disk, in disk order."""
+        rows = []
+        for disk, member in enumerate(self.members):
+            rows.append({
+                "disk": disk,
+                "requests": self.queue_sizes[disk],
+                "total_seek_time": member.total_seek_time,
+                "average_seek_time": member.average_seek_time,
+                "throughput": member.throughput,
+                "total_ms": member.total_ms,
+                "iops": member.iops,
+                "max_wait": member.max_wait,
+                "utilization": member.total_ms / self.makespan_ms if self.makespan_ms else 0,
+            })
+        return rows
+
+    def summary(self):
+        return {
+            "layout": self.layout,
+            "disks": len(self.members),
+            "requests": self.requests,
+            "total_seek_time": self.total_seek_time,
+            "makespan_ms": self.makespan_ms,
+            "iops": self.iops,
+            "max_wait": max(member.max_wait for member in self.members),
+            "hot_disk": self.hot_disk,
+            "imbalance": self.imbalance,
+        }
+
+
+def iter_compare_array(requests, head, algorithms, layout, disks, disk_size=200,
+                       stripe=DEFAULT_STRIPE, direction="right", model=None, writes=None,
+                       max_workers=None):
+    """Yield (algorithm, ArrayResult) as each algorithm finishes on every member.
+
+    Each (algorithm, member) pair is an independent job; large inputs run
+    them across worker processes.
+    """
+    if not 0 <= head < disk_size:
+        raise ValueError(f"head must be between 0 and {disk_size - 1}")
+    algorithms = list(algorithms)
+    queues = map_requests(requests, layout, disks, disk_size, stripe, writes)
+    queue_sizes = [len(queue) for queue in queues]
+    # Idle members are not run, or SCAN-style policies would sweep them anyway
+    idle = ScheduleResult((), head)
+    members = {algo: [idle] * disks for algo in algorithms}
+    jobs = [(algo, disk) for algo in algorithms for disk in range(disks) if queue_sizes[disk]]
+    remaining = {algo: sum(1 for size in queue_sizes if size) for algo in algorithms}
+
+    def finished(algo, disk, result):
+        members[algo][disk] = result
+        remaining[algo] -= 1
+        if not remaining[algo]:
+            return algo, ArrayResult(layout, len(requests), members[algo], queue_sizes)
+        return None
+
+    if not jobs:
+        for algo in algorithms:
+            yield algo, ArrayResult(layout, len(requests), members[algo], queue_sizes)
+        return
+
+    workers = min(len(jobs), max_workers or multiprocessing.cpu_count())
+    if workers <= 1 or len(requests) < PARALLEL_THRESHOLD:
+        for algo, disk in jobs:
+            done = finished(algo, disk, run_algorithm(
+                algo, queues[disk].tolist(), head, direction, disk_size, model))
+            if done:
+                yield done
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # Workers get the scheduler instances, not names, so runtime
+        # registrations are honoured there too
+        results = pool.map(run_algorithm, [algo for algo, _ in jobs],
+                           [queues[disk].tolist() for _, disk in jobs], [head] * len(jobs),
+                           [direction] * len(jobs), [disk_size] * len(jobs), [model] * len(jobs),
+                           [None] * len(jobs), [False] * len(jobs),
+                           [get_scheduler(algo) for algo, _ in jobs])
+        for (algo, disk), result in zip(jobs, results):
+            done = finished(algo, disk, result)
+            if done:
+                yield done
+
+
+def compare_array(requests, head, algorithms, layout, disks, disk_size=200,
+                  stripe=DEFAULT_STRIPE, direction="right", model=None, writes=None,
+                  max_workers=None):
+    results = dict(iter_compare_array(requests, head, algorithms, layout, disks, disk_size,
+                                      stripe, direction, model, writes, max_workers))
+    return {algo: results[algo] for algo in algorithms}
@@ -0,0 +1,232 @@
+from abc import ABC, abstractmethod
+from importlib.metadata import entry_points
+
+from core.fcfs import fcfs
+from core.sstf import prepare_sstf, sstf_prepared
+from core.sptf import prepare_sptf, sptf_prepared
+from core.scan import scan
+from core.cscan import cscan
+from core.look import look
+from core.clook import clook
+from core.deadline import deadline
+from core.nstep import DEFAULT_N, fscan, nstep_scan
+
+# Third-party packages can add schedulers by exposing a Scheduler subclass
+# (or instance) under this entry point group.
+PLUGIN_GROUP = "disk_scheduling.schedulers"
+
+
+class Scheduler(ABC):
+    """One scheduling policy behind a uniform interface.
+
+    prepare() turns a request list into whatever state the policy wants to
+    reuse (a sorted copy, an index, ...); schedule() can then be called any
+    number of times on that state and returns (sequence, total_seek_time).
+    Instances are pickled to worker processes, and their repr (class plus
+    instance attributes) identifies them in cache keys.
+    """
+
+    name = None
+    # Policies that ignore these parameters let callers such as the sweep
+    # engine skip redundant runs.
+    uses_direction = True
+    uses_disk_size = True
+    # Policies that position on rotation set this; they are called as
+    # prepare(requests, angles) and schedule(..., model=drive_model)
+    uses_angles = False
+    # Policies that add positions serving no request (the disk edges SCAN
+    # turns at) set this; run(..., edges=[]) then calls schedule(...,
+    # edges=list) and they append the index of each such position
+    adds_edges = False
+    # Policies with deadlines set this; run(..., stats={}) then calls
+    # schedule(..., stats=dict) and they store "deadline_misses" in it
+    reports_misses = False
+    # Policies too slow to run by default set this; available() then leaves
+    # them out unless include_opt_in is given, and callers must name them
+    opt_in = False
+
+    def prepare(self, requests):
+        return list(requests)
+
+    @abstractmethod
+    def schedule(self, prepared, head, direction="right", disk_size=200):
+        """Return (sequence, total_seek_time) for prepared requests."""
+
+    def __repr__(self):
+        params = ", ".join(f"{key}={value!r}" for key, value in sorted(vars(self).items()))
+        return f"{type(self).__module__}.{type(self).__qualname__}({params})"
+
+    def run(self, requests, head, direction="right", disk_size=200, angles=None, model=None,
+            edges=None, stats=None):
+        options = {}
+        if self.adds_edges and edges is not None:
+            options["edges"] = edges
+        if self.reports_misses and stats is not None:
+            options["stats"] = stats
+        if self.uses_angles:
+            return self.schedule(self.prepare(requests, angles), head, direction, disk_size,
+                                 model=model, **options)
+        return self.schedule(self.prepare(requests), head, direction, disk_size, **options)
+
+
+class FCFSScheduler(Scheduler):
+    name = "FCFS"
+    uses_direction = False
+    uses_disk_size = False
+
+    def schedule(self, prepared, head, direction="right", disk_size=200):
+        return fcfs(prepared, head)
+
+
+class SSTFScheduler(Scheduler):
+    name = "SSTF"
+    uses_direction = False
+    uses_disk_size = False
+
+    def prepare(self, requests):
+        return prepare_sstf(requests)
+
+    def schedule(self, prepared, head, direction="right", disk_size=200):
+        return sstf_prepared(prepared, head)
+
+
+class SPTFScheduler(Scheduler):
+    """SPTF on a drive model; requests without angles are all at angle 0.
+
+    Opt-in: it grows faster than linearly on wide disks (see core.sptf).
+    """
+
+    name = "SPTF"
+    uses_direction = False
+    uses_disk_size = False
+    uses_angles = True
+    opt_in = True
+
+    def __init__(self, model=None):
+        self.model = model
+
+    def prepare(self, requests, angles=None):
+        return prepare_sptf(requests, angles)
+
+    def schedule(self, prepared, head, direction="right", disk_size=200, model=None):
+        return sptf_prepared(prepared, head, model or self.model)
+
+
+class NStepSCANScheduler(Scheduler):
+    """SCAN over successive batches of n requests in arrival order."""
+
+    name = "N-STEP-SCAN"
+    adds_edges = True
+
+    def __init__(self, n=DEFAULT_N):
+        self.n = n
+
+    def schedule(self, prepared, head, direction="right", disk_size=200, edges=None):
+        return nstep_scan(prepared, head, self.n, direction, disk_size, edges)
+
+
+class FSCANScheduler(Scheduler):
+    name = "FSCAN"
+    adds_edges = True
+
+    def schedule(self, prepared, head, direction="right", disk_size=200, edges=None):
+        return fscan(prepared, head, direction, disk_size, edges)
+
+
+class DeadlineScheduler(Scheduler):
+    """mq-deadline on a static queue of reads, with time counted in tracks moved."""
+
+    name = "DEADLINE"
+    uses_direction = False
+    uses_disk_size = False
+    reports_misses = True
+
+    def schedule(self, prepared, head, direction="right", disk_size=200, stats=None):
+        sequence, total_seek_time, deadline_misses = deadline(prepared, head)
+        if stats is not None:
+            stats["deadline_misses"] = deadline_misses
+        return sequence, total_seek_time
+
+
+class SweepScheduler(Scheduler):
+    """SCAN-style policies that share one sorted copy of the requests."""
+
+    function = None
+
+    def prepare(self, requests):
+        return sorted(requests)
+
+    def schedule(self, prepared, head, direction="right", disk_size=200, **options):
+        return type(self).function(prepared, head, direction, disk_size, assume_sorted=True,
+                                   **options)
+
+
+class SCANScheduler(SweepScheduler):
+    name = "SCAN"
+    function = scan
+    adds_edges = True
+
+
+class CSCANScheduler(SweepScheduler):
+    name = "C-SCAN"
+    function = cscan
+    adds_edges = True
+
+
+class LOOKScheduler(SweepScheduler):
+    name = "LOOK"
+    function = look
+
+
+class CLOOKScheduler(SweepScheduler):
+    name = "C-LOOK"
+    function = clook
+
+
+_schedulers = {}
+_plugins_loaded = False
+
+
+def register(scheduler, name=None):
+    """Register a Scheduler subclass or instance; usable as a class decorator."""
+    instance = scheduler() if isinstance(scheduler, type) else scheduler
+    key = (name or instance.name or "").upper()
+    if not key:
+        raise ValueError("Schedulers need a name")
+    _schedulers[key] = instance
+    return scheduler
+
+
+def load_plugins():
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    try:
+        entries = entry_points(group=PLUGIN_GROUP)
+    except TypeError:
+        # Python < 3.10 returns a dict of groups and takes no arguments
+        entries = entry_points().get(PLUGIN_GROUP, [])
+    for entry in entries:
+        register(entry.load(), entry.name)
+
+
+def get_scheduler(name):
+    load_plugins()
+    try:
+        return _schedulers[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm {name!r}") from None
+
+
+def available(include_opt_in=False):
+    """Registered names, without opt-in policies unless include_opt_in is set."""
+    load_plugins()
+    return [name for name, scheduler in _schedulers.items()
+            if include_opt_in or not scheduler.opt_in]
+
+
+for _builtin in (FCFSScheduler, SSTFScheduler, SPTFScheduler, SCANScheduler, CSCANScheduler,
+                 LOOKScheduler, CLOOKScheduler, NStepSCANScheduler, FSCANScheduler,
+                 DeadlineScheduler):
+    register(_builtin)
@@ -0,0 +1,140 @@
+from array import array
+
+from core.cost import NUMPY_THRESHOLD
+
+# Entries shown at each end of a rendered sequence before the middle is elided
+SEQUENCE_PREVIEW = 20
+# Range of the array('i') typecode used for sequences
+INT_MAX = 2 ** (8 * array("i").itemsize - 1) - 1
+INT_MIN = -INT_MAX - 1
+
+
+def _compact(sequence):
+    if isinstance(sequence, array) and sequence.typecode == "i":
+        return sequence
+    compact = array("i")
+    if hasattr(sequence, "astype"):
+        # NumPy, without importing it here. astype() wraps values that do not
+        # fit silently, so check the range the way array.extend() does.
+        if len(sequence) and (sequence.min() < INT_MIN or sequence.max() > INT_MAX):
+            raise OverflowError("sequence values do not fit in a 32-bit array('i')")
+        compact.frombytes(sequence.astype("i").tobytes())
+    else:
+        compact.extend(sequence)
+    return compact
+
+
+class ScheduleResult:
+    """Outcome of one scheduler run.
+
+    The service sequence is held in an array('i'), 4 bytes per entry instead
+    of a list of int objects. Iterating yields the tracks lazily, indexing
+    and slicing go to the array, and format_sequence() renders only the two
+    ends of a long sequence. request_metrics is a core.metrics.RequestMetrics
+    when per-request metrics were collected, otherwise None. sequence is None
+    when the service order was not kept (a streamed trace); the result then
+    has no positions and its turnarounds are unknown (None). deadline_misses
+    counts expired requests for policies with deadlines, otherwise None.
+    """
+
+    __slots__ = ("sequence", "head", "total_seek_time", "average_seek_time", "throughput",
+                 "total_ms", "iops", "max_wait", "request_metrics", "deadline_misses",
+                 "has_sequence", "_turnarounds")
+
+    def __init__(self, sequence, head, total_seek_time=0, average_seek_time=0, throughput=0,
+                 total_ms=0.0, iops=0, max_wait=0, request_metrics=None, deadline_misses=None):
+        self.has_sequence = sequence is not None
+        self.sequence = _compact(sequence if self.has_sequence else ())
+        self.head = head
+        self.total_seek_time = total_seek_time
+        self.average_seek_time = average_seek_time
+        self.throughput = throughput
+        self.total_ms = total_ms
+        self.iops = iops
+        self.max_wait = max_wait
+        self.request_metrics = request_metrics
+        self.deadline_misses = deadline_misses
+        self._turnarounds = None
+
+    def __len__(self):
+        return len(self.sequence)
+
+    def __iter__(self):
+        return iter(self.sequence)
+
+    def __getitem__(self, index):
+        return self.sequence[index]
+
+    def __repr__(self):
+        return (f"ScheduleResult({len(self)} positions, total_seek_time={self.total_seek_time}, "
+                f"total_ms={self.total_ms:.2f})")
+
+    @property
+    def nbytes(self):
+        size = 64 + self.sequence.itemsize * len(self.sequence)
+        if self.request_metrics is not None:
+            size += self.request_metrics.nbytes
+        return size
+
+    @property
+    def turnarounds(self):
+        """Indices into sequence where the head reverses direction.
+
+        The path starts at head. Repeated tracks do not count as a move; the
+        turn is placed at the last visit before the head sets off the other
+        way. Computed once on first use; None when the sequence was not kept.
+        """
+        if self._turnarounds is None and self.has_sequence:
+            if len(self.sequence) < NUMPY_THRESHOLD:
+                self._turnarounds = self._walk_turnarounds()
+            else:
+                self._turnarounds = self._array_turnarounds()
+        return self._turnarounds
+
+    def _walk_turnarounds(self):
+        turns = array("i")
+        previous, heading = self.head, 0
+        for index, track in enumerate(self.sequence):
+            if track != previous:
+                step = 1 if track > previous else -1
+                if heading and step != heading:
+                    # This move starts from sequence[index - 1]
+                    turns.append(index - 1)
+                heading = step
+                previous = track
+        return turns
+
+    def _array_turnarounds(self):
+        import numpy as np
+
+        path = np.empty(len(self.sequence) + 1, dtype=np.int64)
+        path[0] = self.head
+        path[1:] = np.frombuffer(self.sequence, dtype=np.intc)
+        steps = np.sign(np.diff(path))
+        moves = np.flatnonzero(steps)
+        turns = moves[1:][steps[moves[1:]] != steps[moves[:-1]]]
+        # A move starting at path index m starts from sequence[m - 1]
+        return _compact(turns - 1)
+
+    def format_sequence(self, limit=SEQUENCE_PREVIEW):
+        """The sequence as text, eliding the middle when it has more than 2 * limit entries."""
+        if len(self.sequence) <= 2 * limit:
+            return f"[{', '.join(map(str, self.sequence))}]"
+        hidden = len(self.sequence) - 2 * limit
+        return (f"[{', '.join(map(str, self.sequence[:limit]))}, ... {hidden:,} more ..., "
+                f"{', '.join(map(str, self.sequence[-limit:]))}]")
+
+    def summary(self):
+        """Scalar metrics as a dict, without the sequence."""
+        summary = {
+            "total_seek_time": self.total_seek_time,
+            "average_seek_time": self.average_seek_time,
+            "throughput": self.throughput,
+            "total_ms": self.total_ms,
+            "iops": self.iops,
+            "max_wait": self.max_wait,
+            "turnarounds": len(self.turnarounds) if self.has_sequence else None,
+        }
+        if self.deadline_misses is not None:
+            summary["deadline_misses"] = self.deadline_misses
+        return summary
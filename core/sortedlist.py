@@ -0,0 +1,91 @@
+from bisect import bisect_left, insort
+from itertools import islice
+
+
+class SortedList:
+    """A sorted list kept as short sublists.
+
+    Plain bisect.insort and del on one long list move half the list on every
+    change; here a change only moves the references in one sublist of at
+    most 2 * load items, so deep queues stay cheap.
+    """
+
+    load = 512
+
+    def __init__(self, values=()):
+        self.lists = []
+        self.maxes = []
+        values = sorted(values)
+        for start in range(0, len(values), self.load):
+            self.lists.append(values[start:start + self.load])
+            self.maxes.append(self.lists[-1][-1])
+        self.size = len(values)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for sublist in self.lists:
+            yield from sublist
+
+    def add(self, value):
+        if not self.lists:
+            self.lists.append([value])
+            self.maxes.append(value)
+        else:
+            i = bisect_left(self.maxes, value)
+            if i == len(self.maxes):
+                i -= 1
+                self.lists[i].append(value)
+                self.maxes[i] = value
+            else:
+                insort(self.lists[i], value)
+            sublist = self.lists[i]
+            if len(sublist) > 2 * self.load:
+                self.lists.insert(i + 1, sublist[self.load:])
+                del sublist[self.load:]
+                self.maxes.insert(i, sublist[-1])
+        self.size += 1
+
+    def remove(self, value):
+        i = bisect_left(self.maxes, value)
+        if i < len(self.maxes):
+            sublist = self.lists[i]
+            j = bisect_left(sublist, value)
+            if sublist[j] == value:
+                del sublist[j]
+                self.size -= 1
+                if sublist:
+                    self.maxes[i] = sublist[-1]
+                else:
+                    del self.lists[i]
+                    del self.maxes[i]
+                return
+        raise ValueError(f"{value!r} not in list")
+
+    def ceiling(self, value):
+        """Smallest item >= value, or None."""
+        i = bisect_left(self.maxes, value)
+        if i == len(self.maxes):
+            return None
+        sublist = self.lists[i]
+        return sublist[bisect_left(sublist, value)]
+
+    def above(self, value):
+        """Iterate the items >= value in ascending order."""
+        i = bisect_left(self.maxes, value)
+        if i == len(self.maxes):
+            return
+        sublist = self.lists[i]
+        yield from islice(sublist, bisect_left(sublist, value), None)
+        for k in range(i + 1, len(self.lists)):
+            yield from self.lists[k]
+
+    def below(self, value):
+        """Iterate the items < value in descending order."""
+        i = bisect_left(self.maxes, value)
+        if i < len(self.maxes):
+            sublist = self.lists[i]
+            yield from islice(reversed(sublist), len(sublist) - bisect_left(sublist, value), None)
+        for k in range(min(i, len(self.lists)) - 1, -1, -1):
+            yield from reversed(self.lists[k])
@@ -0,0 +1,163 @@
+from bisect import bisect_left, insort
+
+from core.cost import DEFAULT_MODEL
+from core.sortedlist import SortedList
+
+# Angles are in degrees; 0 is where the head sits when scheduling starts
+# unless another head_angle is given.
+
+
+def split_positions(tokens):
+    """Parse "track" or "track:angle" tokens into (tracks, angles).
+
+    angles is None when no token carries an angle; otherwise tokens without
+    one are at angle 0.
+    """
+    tracks = []
+    angles = []
+    positioned = False
+    for token in tokens:
+        track, sep, angle = token.strip().partition(":")
+        tracks.append(int(track))
+        angles.append(float(angle) % 360 if sep else 0.0)
+        positioned = positioned or bool(sep)
+    return tracks, (angles if positioned else None)
+
+
+def prepare_sptf(requests, angles=None):
+    # Requests are bucketed by track, and each bucket keeps its angles sorted
+    # so the first sector to pass under the head is found by bisection.
+    if angles is None:
+        angles = [0.0] * len(requests)
+    elif len(angles) != len(requests):
+        raise ValueError("Every request needs an angle")
+    buckets = {}
+    for i, (track, angle) in enumerate(zip(requests, angles)):
+        insort(buckets.setdefault(track, []), (angle % 360 / 360, i))
+    return sorted(buckets), buckets
+
+
+def sptf_prepared(prepared, head, model=None, head_angle=0.0):
+    model = model or DEFAULT_MODEL
+    tracks, buckets = prepared
+    buckets = {track: list(bucket) for track, bucket in buckets.items()}
+    total_seek_time = 0
+    sequence = []
+    if not tracks:
+        return sequence, total_seek_time
+
+    # Seek times only depend on the distance, so they are modeled once up front
+    span = max(tracks[-1], head) - min(tracks[0], head)
+    # Tracks with pending requests; emptied tracks leave in O(log n)
+    tracks = SortedList(tracks)
+    seek_ms = model.seek_list(range(span + 1))
+    revolution_ms = 60_000 / model.rpm if model.rpm else 0.0
+    transfer_turn = model.transfer_ms / revolution_ms if revolution_ms else 0.0
+    angle = head_angle % 360 / 360
+
+    while tracks:
+        best_time = None
+        upward = tracks.above(head)
+        downward = tracks.below(head)
+        right = next(upward, None)
+        left = next(downward, None)
+
+        # Visit tracks in order of distance. Seek time never falls with
+        # distance, so once it alone exceeds the best positioning time found
+        # no farther track can win.
+        while left is not None or right is not None:
+            if left is None or (right is not None and right - head < head - left):
+                track = right
+                right = next(upward, None)
+            else:
+                track = left
+                left = next(downward, None)
+
+            seek = seek_ms[abs(track - head)]
+            if best_time is not None and seek >= best_time:
+                break
+            bucket = buckets[track]
+            if revolution_ms:
+                arrival = (angle + seek / revolution_ms) % 1
+                slot = bisect_left(bucket, (arrival, -1))
+                if slot == len(bucket):
+                    slot = 0
+                time = seek + (bucket[slot][0] - arrival) % 1 * revolution_ms
+            else:
+                slot = 0
+                time = seek
+            if best_time is None or time < best_time:
+                best_time, best_track, best_slot = time, track, slot
+
+        bucket = buckets[best_track]
+        sector, _ = bucket.pop(best_slot)
+        if not bucket:
+            del buckets[best_track]
+            tracks.remove(best_track)
+        total_seek_time += abs(best_track - head)
+        sequence.append(best_track)
+        head = best_track
+        if revolution_ms:
+            angle = (sector + transfer_turn) % 1
+
+    return sequence, total_seek_time
+
+
+def positioned_time(sequence, head, requests, angles, model=None, head_angle=0.0):
+    """Modeled milliseconds to serve `sequence` when request angles are known.
+
+    Unlike DriveModel.total_time, which charges the average half revolution,
+    this follows the platter: each visit to a track serves the pending
+    request on it whose angle comes under the head first. Positions with no
+    pending request (the disk edges SCAN turns at) cost only the seek.
+    """
+    model = model or DEFAULT_MODEL
+    _, buckets = prepare_sptf(requests, angles)
+    if not sequence:
+        return 0.0
+    span = max(max(sequence), head) - min(min(sequence), head)
+    seek_ms = model.seek_list(range(span + 1))
+    revolution_ms = 60_000 / model.rpm if model.rpm else 0.0
+    transfer_turn = model.transfer_ms / revolution_ms if revolution_ms else 0.0
+    angle = head_angle % 360 / 360
+    total_ms = 0.0
+
+    for track in sequence:
+        seek = seek_ms[abs(track - head)]
+        bucket = buckets.get(track)
+        head = track
+        if not bucket:
+            total_ms += seek
+            if revolution_ms:
+                angle = (angle + seek / revolution_ms) % 1
+            continue
+        if revolution_ms:
+            arrival = (angle + seek / revolution_ms) % 1
+            slot = bisect_left(bucket, (arrival, -1))
+            if slot == len(bucket):
+                slot = 0
+            sector, _ = bucket.pop(slot)
+            total_ms += seek + (sector - arrival) % 1 * revolution_ms
+            angle = (sector + transfer_turn) % 1
+        else:
+            bucket.pop()
+            total_ms += seek
+        total_ms += model.transfer_ms
+    return total_ms
+
+
+def sptf(requests, head, angles=None, model=None, head_angle=0.0):
+    """Shortest Positioning Time First: serve the request reachable soonest.
+
+    Positioning time is the modeled seek plus the rotational delay until the
+    request's angle passes under the head, using the seek curve, rpm and
+    transfer time of a core.cost.DriveModel.
+
+    Each step examines every track with pending requests whose seek alone
+    is shorter than the best positioning time found, so the cost per request
+    grows with the number of such tracks within about one revolution's worth
+    of seek. Without angles every request sits at angle 0 and most moves
+    wait a full revolution, which is the slow case on wide disks: 32k
+    requests over 10,000 tracks take seconds, where SSTF takes milliseconds.
+    """
+    return sptf_prepared(prepare_sptf(requests, angles), head, model, head_angle)
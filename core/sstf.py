@@ -1,12 +1,55 @@
-def sstf(requests, head):
+from bisect import bisect_left
+
+
+def prepare_sstf(requests):
+    # Count each track once and remember where it first appears; on an equal
+    # distance tie the track that came first in the queue is served first.
+    counts = {}
+    first_seen = {}
+    for i, r in enumerate(requests):
+        if r in counts:
+            counts[r] += 1
+        else:
+            counts[r] = 1
+            first_seen[r] = i
+    return sorted(counts), counts, first_seen
+
+
+def sstf_prepared(prepared, head):
+    tracks, counts, first_seen = prepared
     total_seek_time = 0
     sequence = []
-    requests = requests.copy()
-    while requests:
-        nearest = min(requests, key=lambda x: abs(x - head))
-        seek_time = abs(head - nearest)
-        total_seek_time += seek_time
-        sequence.append(nearest)
+
+    right = bisect_left(tracks, head)
+    left = right - 1
+
+    # The served tracks always form a contiguous run of the sorted tracks, so
+    # the next request is either just left or just right of that run.
+    while left >= 0 or right < len(tracks):
+        if left < 0:
+            nearest = tracks[right]
+            right += 1
+        elif right >= len(tracks):
+            nearest = tracks[left]
+            left -= 1
+        else:
+            left_seek = head - tracks[left]
+            right_seek = tracks[right] - head
+            if left_seek < right_seek or (
+                left_seek == right_seek and first_seen[tracks[left]] < first_seen[tracks[right]]
+            ):
+                nearest = tracks[left]
+                left -= 1
+            else:
+                nearest = tracks[right]
+                right += 1
+
+        total_seek_time += abs(head - nearest)
+        sequence.extend([nearest] * counts[nearest])
         head = nearest
-        requests.remove(nearest)
+
     return sequence, total_seek_time
+
+
+def sstf(requests, head):
+    return sstf_prepared(prepare_sstf(requests), head)
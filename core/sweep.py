@@ -0,0 +1,189 @@
+import argparse
+import csv
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.compare import PARALLEL_THRESHOLD
+from core.metrics import seek_metrics
+from core.registry import (CLOOKScheduler, CSCANScheduler, FCFSScheduler, LOOKScheduler,
+                           SCANScheduler, available, get_scheduler)
+from core.vectorized import clook_array, cscan_array, look_array, scan_array
+
+# Built-in sweep policies run on the shared sorted array in vectorized form
+SWEEP_FAMILY = {
+    SCANScheduler: scan_array,
+    CSCANScheduler: cscan_array,
+    LOOKScheduler: look_array,
+    CLOOKScheduler: clook_array,
+}
+
+COLUMNS = ["algorithm", "head", "direction", "disk_size",
+           "total_seek_time", "average_seek_time", "throughput"]
+
+
+def _sweep_rows(requests, requests_sorted, heads, directions, disk_sizes, schedulers):
+    rows = []
+    count = len(requests)
+    algorithms = list(schedulers)
+    # FCFS only depends on the head through the first move
+    fcfs_base = int(np.abs(np.diff(requests)).sum())
+    # Any other policy is prepared once and reused for every combination
+    prepared = {
+        algo: scheduler.prepare(requests.tolist())
+        for algo, scheduler in schedulers.items()
+        if type(scheduler) not in SWEEP_FAMILY and not isinstance(scheduler, FCFSScheduler)
+    }
+
+    def total_seek(algo, head, direction, disk_size):
+        scheduler = schedulers[algo]
+        if isinstance(scheduler, FCFSScheduler):
+            return fcfs_base + (abs(head - int(requests[0])) if count else 0)
+        if type(scheduler) in SWEEP_FAMILY:
+            return SWEEP_FAMILY[type(scheduler)](
+                requests_sorted, head, direction, disk_size, assume_sorted=True)[1]
+        return scheduler.schedule(prepared[algo], head, direction, disk_size)[1]
+
+    for head in heads:
+        # Policies that ignore direction or disk size run once per head
+        totals = {}
+        for direction, disk_size in product(directions, disk_sizes):
+            for algo in algorithms:
+                scheduler = schedulers[algo]
+                key = (algo,
+                       direction if scheduler.uses_direction else None,
+                       disk_size if scheduler.uses_disk_size else None)
+                if key not in totals:
+                    totals[key] = total_seek(algo, head, direction, disk_size)
+                total_seek_time = totals[key]
+                rows.append((algo, head, direction, disk_size, total_seek_time)
+                            + seek_metrics(count, total_seek_time))
+    return rows
+
+
+def _sweep_shared(shm_name, count, heads, directions, disk_sizes, schedulers):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        both = np.ndarray((2, count), dtype=np.int64, buffer=shm.buf)
+        rows = _sweep_rows(both[0], both[1], heads, directions, disk_sizes, schedulers)
+        del both
+    finally:
+        shm.close()
+    return rows
+
+
+def sweep(requests, heads, directions=("right", "left"), disk_sizes=(200,), algorithms=None,
+          max_workers=None):
+    """Run every algorithm over the cartesian product of the parameters.
+
+    Returns a column-oriented table: a dict mapping each name in COLUMNS to a
+    list of values, one entry per (head, direction, disk_size, algorithm).
+    """
+    algorithms = [algo.upper() for algo in (algorithms or available())]
+    # Raises ValueError for unknown names. Workers get the instances rather
+    # than names, so schedulers registered at runtime work there too.
+    schedulers = {algo: get_scheduler(algo) for algo in algorithms}
+    heads = list(heads)
+    directions = list(directions)
+    disk_sizes = list(disk_sizes)
+
+    requests = np.asarray(requests, dtype=np.int64)
+    if len(requests) and (requests.min() < 0 or requests.max() >= min(disk_sizes)):
+        raise ValueError(f"All requests must be between 0 and {min(disk_sizes) - 1}")
+
+    # One sorted copy serves every SCAN/C-SCAN/LOOK/C-LOOK run
+    requests_sorted = np.sort(requests)
+
+    workers = min(len(heads), max_workers or multiprocessing.cpu_count())
+    if workers <= 1 or len(requests) * len(heads) < PARALLEL_THRESHOLD:
+        rows = _sweep_rows(requests, requests_sorted, heads, directions, disk_sizes, schedulers)
+    else:
+        # Both arrays go into one shared block that every worker maps directly
+        shm = shared_memory.SharedMemory(create=True, size=2 * max(len(requests), 1) * 8)
+        try:
+            both = np.ndarray((2, len(requests)), dtype=np.int64, buffer=shm.buf)
+            both[0] = requests
+            both[1] = requests_sorted
+            del both
+
+            batches = [heads[i::workers] for i in range(workers)]
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                parts = pool.map(_sweep_shared, [shm.name] * workers, [len(requests)] * workers,
+                                 batches, [directions] * workers, [disk_sizes] * workers,
+                                 [schedulers] * workers)
+                rows = [row for part in parts for row in part]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    rows.sort(key=lambda row: (row[1], row[2], row[3], algorithms.index(row[0])))
+    return {name: [row[i] for row in rows] for i, name in enumerate(COLUMNS)}
+
+
+def write_table(table, path):
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("Writing Parquet needs the pyarrow package")
+        pyarrow.parquet.write_table(pyarrow.table(table), path)
+        return
+
+    if path == "-":
+        _write_csv(table, sys.stdout)
+    else:
+        with open(path, "w", newline="") as f:
+            _write_csv(table, f)
+
+
+def _write_csv(table, f):
+    writer = csv.writer(f)
+    writer.writerow(COLUMNS)
+    writer.writerows(zip(*(table[name] for name in COLUMNS)))
+
+
+def parse_heads(values):
+    heads = []
+    for value in values:
+        if ":" in value:
+            heads.extend(range(*(int(part) for part in value.split(":"))))
+        else:
+            heads.append(int(value))
+    return heads
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep every algorithm over head positions, directions and disk sizes.")
+    parser.add_argument("requests", help="file with comma or whitespace separated requests")
+    parser.add_argument("--heads", nargs="+", required=True, metavar="HEAD",
+                        help="head positions, each a number or a start:stop[:step] range")
+    parser.add_argument("--directions", nargs="+", choices=["right", "left"],
+                        default=["right", "left"])
+    parser.add_argument("--disk-sizes", type=int, nargs="+", default=[200])
+    parser.add_argument("-a", "--algorithms", nargs="+", type=str.upper,
+                        choices=available(include_opt_in=True), default=available(), metavar="ALGO")
+    parser.add_argument("-o", "--output", default="-",
+                        help="CSV file, or .parquet when pyarrow is installed (default: stdout)")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        heads = parse_heads(args.heads)
+        with open(args.requests) as f:
+            requests = f.read().replace(",", " ").split()
+        requests = np.array(requests, dtype=np.int64)
+        table = sweep(requests, heads, args.directions, args.disk_sizes, args.algorithms, args.jobs)
+        write_table(table, args.output)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
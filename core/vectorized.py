@@ -0,0 +1,103 @@
+import numpy as np
+
+# Array-in/array-out versions of the list based schedulers. Each one takes an
+# integer NumPy array and returns (sequence, total_seek_time) with the same
+# values as the matching function in core/, with the sequence as an array.
+# scan_array and cscan_array take the same edges list as scan and cscan.
+
+
+def _as_array(requests):
+    requests = np.asarray(requests)
+    if requests.dtype.kind not in "iu":
+        requests = requests.astype(np.int64)
+    return requests
+
+
+def _total_seek(head, sequence):
+    path = np.empty(len(sequence) + 1, dtype=np.int64)
+    path[0] = head
+    path[1:] = sequence
+    return int(np.abs(np.diff(path)).sum())
+
+
+def _split(requests, head, direction, assume_sorted):
+    requests_sorted = requests if assume_sorted else np.sort(requests)
+    # Requests at the head belong to the sweep that starts first
+    side = "left" if direction == "right" else "right"
+    i = np.searchsorted(requests_sorted, head, side=side)
+    return requests_sorted[:i], requests_sorted[i:]
+
+
+def fcfs_array(requests, head):
+    sequence = _as_array(requests).copy()
+    return sequence, _total_seek(head, sequence)
+
+
+def _add_edges(edges, first_pass, count):
+    # Edge points sit between the first pass and the second
+    if edges is not None:
+        edges.extend(range(first_pass, first_pass + count))
+
+
+def scan_array(requests, head, direction="right", disk_size=200, assume_sorted=False,
+               edges=None):
+    requests = _as_array(requests)
+    left, right = _split(requests, head, direction, assume_sorted)
+    dtype = requests.dtype
+
+    if direction == "right":
+        last = right[-1] if len(right) else head
+        end = np.array([disk_size - 1] if last != disk_size - 1 else [], dtype=dtype)
+        sequence = np.concatenate((right, end, left[::-1]))
+        _add_edges(edges, len(right), len(end))
+    else:
+        last = left[0] if len(left) else head
+        start = np.array([0] if last != 0 else [], dtype=dtype)
+        sequence = np.concatenate((left[::-1], start, right))
+        _add_edges(edges, len(left), len(start))
+
+    return sequence, _total_seek(head, sequence)
+
+
+def cscan_array(requests, head, direction="right", disk_size=200, assume_sorted=False,
+                edges=None):
+    requests = _as_array(requests)
+    left, right = _split(requests, head, direction, assume_sorted)
+    dtype = requests.dtype
+
+    if direction == "right":
+        last = right[-1] if len(right) else head
+        end = [disk_size - 1] if last != disk_size - 1 else []
+        sequence = np.concatenate((right, np.array(end + [0], dtype=dtype), left))
+        _add_edges(edges, len(right), len(end) + 1)
+    else:
+        last = left[0] if len(left) else head
+        start = [0] if last != 0 else []
+        sequence = np.concatenate((left[::-1], np.array(start + [disk_size - 1], dtype=dtype), right[::-1]))
+        _add_edges(edges, len(left), len(start) + 1)
+
+    return sequence, _total_seek(head, sequence)
+
+
+def look_array(requests, head, direction="right", disk_size=200, assume_sorted=False):
+    requests = _as_array(requests)
+    left, right = _split(requests, head, direction, assume_sorted)
+
+    if direction == "right":
+        sequence = np.concatenate((right, left[::-1]))
+    else:
+        sequence = np.concatenate((left[::-1], right))
+
+    return sequence, _total_seek(head, sequence)
+
+
+def clook_array(requests, head, direction="right", disk_size=200, assume_sorted=False):
+    requests = _as_array(requests)
+    left, right = _split(requests, head, direction, assume_sorted)
+
+    if direction == "right":
+        sequence = np.concatenate((right, left))
+    else:
+        sequence = np.concatenate((left[::-1], right[::-1]))
+
+    return sequence, _total_seek(head, sequence)
@@ -1,11 +1,14 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-from core.fcfs import fcfs
-from core.sstf import sstf
-from core.scan import scan
-from core.cscan import cscan
-from core.look import look
-from core.clook import clook
+from core.cache import ResultCache
+from core.compare import iter_compare, run_algorithm
+from core.raid import LAYOUTS, iter_compare_array
+from core.cost import DEFAULT_MODEL, SEEK_CURVES, DriveModel
+from core.registry import available
+from core.sptf import split_positions
+from gui.results_view import ResultsView
+from gui.worker import BackgroundTask, Cancelled
+from traces.synthetic import PATTERNS, generate, write_mix
 from visualization.plot import animate_sequence
 
 class DiskSchedulingSimulator:
@@ -100,6 +103,11 @@ class DiskSchedulingSimulator:
                 "• Services the nearest request to the current head position\n"
                 "• Reduces average seek time compared to FCFS\n"
                 "• May cause starvation for distant requests",
+
+        "SPTF": "Shortest Positioning Time First (SPTF):\n"
+                "• Services the request the head can reach soonest, counting rotation\n"
+                "• Enter requests as track:angle (degrees) to use rotational position\n"
+                "• Lowest service time, but may starve requests just past the head",
                 
         "SCAN": "SCAN (Elevator Algorithm):\n"
                 "• Moves the head back and forth across the disk\n"
@@ -117,7 +125,22 @@ class DiskSchedulingSimulator:
                 
         "C-LOOK": "C-LOOK Algorithm:\n"
                   "• Like C-SCAN but only travels to the last request\n"
-                  "• Combines benefits of C-SCAN and LOOK"
+                  "• Combines benefits of C-SCAN and LOOK",
+
+        "N-STEP-SCAN": "N-Step SCAN:\n"
+                       "• Splits the queue into batches of N requests in arrival order\n"
+                       "• Each batch is frozen and served by one SCAN pass\n"
+                       "• Bounds how long a request can be overtaken by newer ones",
+
+        "FSCAN": "FSCAN:\n"
+                 "• Freezes the queue when a sweep starts; new requests wait for the next\n"
+                 "• Same as SCAN when every request is known up front\n"
+                 "• Prevents arrivals near the head from starving far requests",
+
+        "DEADLINE": "Deadline (Linux mq-deadline):\n"
+                    "• Serves batches in sector order, one direction at a time\n"
+                    "• Jumps to the oldest request once its deadline has expired\n"
+                    "• Here every request is a read and time counts tracks moved"
         }
 
         self.detailed_descriptions = {
@@ -162,6 +185,25 @@ class DiskSchedulingSimulator:
                 "time_complexity": "O(n log n) - due to finding closest request",
             },
 
+            "SPTF": {
+                "title": "Shortest Positioning Time First (SPTF)",
+
+                "description": """SPTF picks the next request by total positioning time: the seek to its track plus the rotational delay until its sector passes under the head.
+                A request a few tracks away can beat the nearest one if its sector arrives sooner, which is why drives with their own queues schedule this way.
+                Requests are entered as track:angle, with the angle in degrees.
+                \nBest for: Deep queues on rotating disks.""",
+
+                "Advantages": [
+                    "• Lowest service time: Accounts for rotation as well as seek distance.",
+                    "• Indexed search: Only tracks whose seek time alone can still win are examined."
+                ],
+                'Disadvantages': [
+                    "• Starvation Risk: Like SSTF, unlucky requests can wait a long time.",
+                    "• Needs rotational position of every request and a model of the drive."
+                ],
+                "time_complexity": "O(n * k) - k tracks within one revolution of seek time",
+            },
+
             "SCAN": {
                 "title": "SCAN (Elevator Algorithm)",
 
@@ -257,6 +299,11 @@ class DiskSchedulingSimulator:
 
         }
 
+        # Scheduler run currently executing off the Tk thread, if any
+        self.task = None
+        # Repeated comparisons of the same input are answered from here
+        self.result_cache = ResultCache()
+
         self.create_widgets()
 
     def show_algorithm_details(self):
@@ -361,7 +408,7 @@ class DiskSchedulingSimulator:
     def open_new_window(self):
         new_window = tk.Toplevel(self.root)
         new_window.title("Compare Disk Scheduling Algorithms")
-        new_window.geometry("600x600+600+200")
+        new_window.geometry("760x900+500+50")
         
         # Configure window background
         new_window.configure(bg=self.colors['background'])
@@ -376,6 +423,11 @@ class DiskSchedulingSimulator:
                  font=('Segoe UI', 11)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         self.request_entry = ttk.Entry(container, width=40)
         self.request_entry.grid(row=0, column=1, sticky="w", padx=10, pady=5)
+        ttk.Button(container,
+                  text="Generate...",
+                  command=lambda: self.open_generate_window(self.request_entry,
+                                                            self.disk_size_entry),
+                  style='Secondary.TButton').grid(row=0, column=2, padx=5, pady=5)
         
         ttk.Label(container, 
                  text="Initial Head Position:",
@@ -389,14 +441,66 @@ class DiskSchedulingSimulator:
         self.disk_size_entry = ttk.Entry(container)
         self.disk_size_entry.insert(0, "200")
         self.disk_size_entry.grid(row=2, column=1, padx=10, pady=5)
+
+        # Drive model used for the modeled milliseconds and IOPS
+        ttk.Label(container,
+                 text="Seek Model:",
+                 font=('Segoe UI', 11)).grid(row=3, column=0, sticky="w", padx=10, pady=5)
+        self.seek_model_var = tk.StringVar(value="sqrt")
+        ttk.Combobox(container,
+                     textvariable=self.seek_model_var,
+                     values=list(SEEK_CURVES),
+                     state='readonly',
+                     width=17).grid(row=3, column=1, padx=10, pady=5)
+
+        ttk.Label(container,
+                 text="Spindle Speed (RPM):",
+                 font=('Segoe UI', 11)).grid(row=4, column=0, sticky="w", padx=10, pady=5)
+        self.rpm_entry = ttk.Entry(container)
+        self.rpm_entry.insert(0, str(DEFAULT_MODEL.rpm))
+        self.rpm_entry.grid(row=4, column=1, padx=10, pady=5)
+
+        # Optional disk array; requests are then logical tracks striped over the members
+        ttk.Label(container,
+                 text="Array Layout:",
+                 font=('Segoe UI', 11)).grid(row=5, column=0, sticky="w", padx=10, pady=5)
+        self.layout_var = tk.StringVar(value="Single Disk")
+        ttk.Combobox(container,
+                     textvariable=self.layout_var,
+                     values=["Single Disk", *LAYOUTS],
+                     state='readonly',
+                     width=17).grid(row=5, column=1, padx=10, pady=5)
+
+        ttk.Label(container,
+                 text="Member Disks:",
+                 font=('Segoe UI', 11)).grid(row=6, column=0, sticky="w", padx=10, pady=5)
+        self.disks_entry = ttk.Entry(container)
+        self.disks_entry.insert(0, "4")
+        self.disks_entry.grid(row=6, column=1, padx=10, pady=5)
+
+        # Share of array requests that are writes (mirrors and parity pay for them)
+        ttk.Label(container,
+                 text="Write Ratio (0-1):",
+                 font=('Segoe UI', 11)).grid(row=7, column=0, sticky="w", padx=10, pady=5)
+        self.write_ratio_entry = ttk.Entry(container)
+        self.write_ratio_entry.insert(0, "0")
+        self.write_ratio_entry.grid(row=7, column=1, padx=10, pady=5)
+
+        # Tail percentiles, histogram and fairness over the individual requests
+        self.per_request_var = tk.BooleanVar()
+        ttk.Checkbutton(container,
+                        text="Per-request metrics",
+                        variable=self.per_request_var,
+                        style='TCheckbutton').grid(row=8, column=0, columnspan=2, sticky='w', padx=10)
         
         # Algorithm Checkboxes with improved styling
         ttk.Label(container, 
                  text="Select Algorithms for Comparison:",
-                 font=('Segoe UI', 11, 'bold')).grid(row=3, column=0, columnspan=2, padx=10, pady=5)
+                 font=('Segoe UI', 11, 'bold')).grid(row=9, column=0, columnspan=2, padx=10, pady=5)
         
         self.algorithm_vars = {}
-        algorithms = ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]
+        algorithms = available(include_opt_in=True)
+        button_row = 10 + len(algorithms)
         
         for i, algo in enumerate(algorithms):
             var = tk.BooleanVar()
@@ -404,80 +508,212 @@ class DiskSchedulingSimulator:
             ttk.Checkbutton(container, 
                           text=algo,
                           variable=var,
-                          style='TCheckbutton').grid(row=4+i, column=0, columnspan=2, sticky='w', padx=20)
+                          style='TCheckbutton').grid(row=10+i, column=0, columnspan=2, sticky='w', padx=20)
         
         # Compare Button with improved styling
         ttk.Button(container, 
                   text="Compare Algorithms",
                   command=self.compare_algorithms,
-                  style='Primary.TButton').grid(row=10, column=0, columnspan=2, pady=20)
-        
-        # Text Box for Results with improved styling
-        self.result_text = tk.Text(container, 
-                                 height=15, 
-                                 width=70, 
-                                 wrap='word', 
-                                 state='disabled',
-                                 bg='white',
-                                 font=('Segoe UI', 10),
-                                 relief='solid',
-                                 padx=10,
-                                 pady=10)
-        self.result_text.grid(row=11, column=0, columnspan=2, padx=10, pady=10)
+                  style='Primary.TButton').grid(row=button_row, column=0, pady=20)
+        
+        ttk.Button(container,
+                  text="Cancel",
+                  command=self.cancel_task,
+                  style='Secondary.TButton').grid(row=button_row, column=1, pady=20)
+        
+        # Results: summary table plus a paged view of each sequence
+        self.results_view = ResultsView(container)
+        self.results_view.grid(row=button_row + 1, column=0, columnspan=3, sticky='nsew',
+                               padx=10, pady=10)
+        container.grid_rowconfigure(button_row + 1, weight=1)
+        container.grid_columnconfigure(1, weight=1)
         
         # Close Button with improved styling
         ttk.Button(container, 
                   text="Close",
                   command=new_window.destroy,
-                  style='Accent.TButton').grid(row=12, column=0, columnspan=2, pady=10)
+                  style='Accent.TButton').grid(row=button_row + 2, column=0, columnspan=2, pady=10)
+
+    def open_generate_window(self, request_entry, disk_size_entry):
+        """Fill request_entry with a seeded synthetic workload"""
+        gen_window = tk.Toplevel(self.root)
+        gen_window.title("Generate Requests")
+        gen_window.configure(bg=self.colors['background'])
+
+        container = ttk.Frame(gen_window, padding="15")
+        container.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(container,
+                 text="Pattern:",
+                 font=('Segoe UI', 11)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
+        pattern_var = tk.StringVar(value="uniform")
+        ttk.Combobox(container,
+                     textvariable=pattern_var,
+                     values=list(PATTERNS),
+                     state='readonly',
+                     width=17).grid(row=0, column=1, padx=10, pady=5)
+
+        ttk.Label(container,
+                 text="Number of Requests:",
+                 font=('Segoe UI', 11)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        count_entry = ttk.Entry(container)
+        count_entry.insert(0, "100")
+        count_entry.grid(row=1, column=1, padx=10, pady=5)
+
+        ttk.Label(container,
+                 text="Seed:",
+                 font=('Segoe UI', 11)).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        seed_entry = ttk.Entry(container)
+        seed_entry.insert(0, "0")
+        seed_entry.grid(row=2, column=1, padx=10, pady=5)
+
+        def start():
+            if self.task_running():
+                return
+            try:
+                count = int(count_entry.get())
+                seed = int(seed_entry.get())
+                disk_size = int(disk_size_entry.get() or 200)
+                if count < 0 or disk_size <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Invalid Input", "Please enter valid numbers.")
+                return
+            pattern = pattern_var.get()
+
+            def run(report, cancelled):
+                report(f"Generating {count} {pattern} requests...")
+                tracks, _, _ = generate(count, pattern, disk_size, seed)
+                return ",".join(map(str, tracks.tolist()))
+
+            def done(text):
+                # Either window may have been closed while generating
+                if request_entry.winfo_exists():
+                    request_entry.delete(0, tk.END)
+                    request_entry.insert(0, text)
+                if gen_window.winfo_exists():
+                    gen_window.destroy()
+                self.status_var.set(f"Generated {count} {pattern} requests (seed {seed})")
+
+            self.run_task(run, done)
+
+        ttk.Button(container,
+                  text="Generate",
+                  command=start,
+                  style='Primary.TButton').grid(row=3, column=0, pady=15)
+
+        ttk.Button(container,
+                  text="Close",
+                  command=gen_window.destroy,
+                  style='Accent.TButton').grid(row=3, column=1, pady=15)
 
     # Perform Algorithm Comparison
     def compare_algorithms(self):
+        if self.task_running():
+            return
+
         try:
-            requests = list(map(int, self.request_entry.get().split(',')))
+            requests, angles = split_positions(self.request_entry.get().split(','))
             head = int(self.head_entry.get())
             disk_size = int(self.disk_size_entry.get())
+            rpm = int(self.rpm_entry.get())
+            disks = int(self.disks_entry.get())
+            write_ratio = float(self.write_ratio_entry.get())
+            if rpm < 0 or not 0 <= write_ratio <= 1:
+                raise ValueError
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numbers.")
             return
+        model = DriveModel(SEEK_CURVES[self.seek_model_var.get()](), rpm)
+        layout = self.layout_var.get()
+        if layout not in LAYOUTS:
+            layout = None
+        per_request = self.per_request_var.get() and not layout
 
         selected_algorithms = [algo for algo, var in self.algorithm_vars.items() if var.get()]
         if not selected_algorithms:
             messagebox.showwarning("No Algorithm Selected", "Please select at least one algorithm.")
             return
 
-        results = {}
-        output_text = "Comparison Results:\n\n"
-        
-        for algo in selected_algorithms:
-            if algo == "FCFS":
-                sequence, total_seek_time = fcfs(requests.copy(), head)
-            elif algo == "SSTF":
-                sequence, total_seek_time = sstf(requests.copy(), head)
-            elif algo == "SCAN":
-                sequence, total_seek_time = scan(requests.copy(), head, "right", disk_size)
-            elif algo == "C-SCAN":
-                sequence, total_seek_time = cscan(requests.copy(), head, "right", disk_size)
-            elif algo == "LOOK":
-                sequence, total_seek_time = look(requests.copy(), head, "right", disk_size)
-            elif algo == "C-LOOK":
-                sequence, total_seek_time = clook(requests.copy(), head, "right", disk_size)
-
-            average_seek_time = total_seek_time / len(requests) if requests else 0
-            throughput = len(requests) / total_seek_time if total_seek_time != 0 else 0
-
-            results[algo] = (sequence, total_seek_time, average_seek_time, throughput)
-
+        def run(report, cancelled):
+            report(f"Comparing {len(selected_algorithms)} algorithms on {len(requests)} requests...")
+            results = {}
+            if layout:
+                writes = write_mix(len(requests), write_ratio) if write_ratio else None
+                runs = iter_compare_array(requests, head, selected_algorithms, layout, disks,
+                                          disk_size, model=model, writes=writes)
+            else:
+                runs = iter_compare(requests, head, selected_algorithms, "right", disk_size,
+                                    cache=self.result_cache, model=model, angles=angles,
+                                    per_request=per_request)
+            try:
+                for algo, result in runs:
+                    if cancelled.is_set():
+                        raise Cancelled()
+                    results[algo] = result
+                    report(f"Compared {len(results)}/{len(selected_algorithms)} algorithms ({algo} done)")
+            finally:
+                runs.close()
+            return {algo: results[algo] for algo in selected_algorithms}
+
+        def done(results):
+            if layout:
+                self.display_results(self.format_array_results(results))
+                self.status_var.set("Array comparison completed successfully")
+                return
+
+            # The Compare window may have been closed while a run was in progress
+            if self.results_view.winfo_exists():
+                self.results_view.show_results(results)
+            stats = self.result_cache.stats()
+            self.status_var.set(f"Comparison completed successfully "
+                                f"(cache: {stats['hits']} hits, {stats['misses']} misses)")
+
+        self.display_results("Comparing...")
+        self.run_task(run, done)
+
+    def format_array_results(self, results):
+        output_text = "Array Comparison Results:\n\n"
+        for algo, result in results.items():
+            summary = result.summary()
             output_text += (
-                f"Algorithm: {algo}\n"
-                f"Sequence: {sequence}\n"
-                f"Total Seek Time: {total_seek_time}\n"
-                f"Average Seek Time: {average_seek_time:.2f}\n"
-                f"Throughput: {throughput:.2f} requests per unit time\n"
-                f"{'-'*60}\n"
+                f"Algorithm: {algo} on {summary['layout']} x {summary['disks']}\n"
+                f"Total Seek Time: {summary['total_seek_time']}\n"
+                f"Array Time: {summary['makespan_ms']:.2f} ms ({summary['iops']:.1f} IOPS)\n"
+                f"Max Wait: {summary['max_wait']} places behind arrival order\n"
+                f"Hot Disk: {summary['hot_disk']} (imbalance {summary['imbalance']:.2f}x)\n"
             )
-
-        self.display_results(output_text)
+            for row in result.disk_rows():
+                output_text += (
+                    f"  Disk {row['disk']}: {row['requests']} requests, "
+                    f"seek {row['total_seek_time']}, {row['total_ms']:.2f} ms, "
+                    f"{row['utilization']:.0%} busy\n"
+                )
+            output_text += f"{'-'*60}\n"
+        return output_text
+
+    def task_running(self):
+        if self.task is not None and self.task.running:
+            messagebox.showwarning("Simulation Running",
+                                   "Please wait for the current run to finish or cancel it.")
+            return True
+        return False
+
+    def run_task(self, func, on_done):
+        """Run func on a worker thread, showing its progress in the status bar"""
+        self.task = BackgroundTask(self.root, func, on_done,
+                                   on_error=self.task_failed,
+                                   on_progress=self.status_var.set,
+                                   on_cancel=lambda: self.status_var.set("Cancelled")).start()
+
+    def task_failed(self, error):
+        messagebox.showerror("Error", str(error))
+        self.status_var.set("Error in simulation")
+
+    def cancel_task(self):
+        if self.task is not None and self.task.running:
+            self.task.cancel()
+            self.status_var.set("Cancelling...")
 
     def update_description(self, *args):
         """Update the description text when algorithm changes"""
@@ -489,12 +725,12 @@ class DiskSchedulingSimulator:
         self.desc_text.insert(tk.END, description)
         self.desc_text.config(state='disabled')
 
-    # Display results in the Text widget
+    # Display a text message in the results view
     def display_results(self, text):
-        self.result_text.config(state='normal')
-        self.result_text.delete('1.0', tk.END)
-        self.result_text.insert(tk.END, text)
-        self.result_text.config(state='disabled')
+        # The Compare window may have been closed while a run was in progress
+        if not self.results_view.winfo_exists():
+            return
+        self.results_view.show_message(text)
 
     
     def create_widgets(self):
@@ -546,7 +782,7 @@ class DiskSchedulingSimulator:
         # Algorithm Selection with improved styling
         ttk.Label(input_frame, text="Algorithm:").grid(row=3, column=0, sticky=tk.W, pady=5)
         self.algorithm_var = tk.StringVar(value="FCFS")
-        algorithms = ["FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"]
+        algorithms = available(include_opt_in=True)
         self.algorithm_menu = ttk.OptionMenu(input_frame, self.algorithm_var, "FCFS", *algorithms)
         self.algorithm_menu.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
         
@@ -589,6 +825,13 @@ class DiskSchedulingSimulator:
                                      command=self.clear_fields,
                                      style='Accent.TButton')
         self.clear_button.pack(side=tk.LEFT, padx=5)
+
+        self.generate_button = ttk.Button(button_frame,
+                                        text="Generate Requests",
+                                        command=lambda: self.open_generate_window(
+                                            self.entry_requests, self.entry_disk_size),
+                                        style='Secondary.TButton')
+        self.generate_button.pack(side=tk.LEFT, padx=5)
         
         self.details_button = ttk.Button(button_frame,
                                        text="Detailed Description",
@@ -602,6 +845,12 @@ class DiskSchedulingSimulator:
                                           style='Secondary.TButton')
         self.new_window_button.pack(side=tk.LEFT, padx=5)
         
+        self.cancel_button = ttk.Button(button_frame,
+                                      text="Cancel",
+                                      command=self.cancel_task,
+                                      style='Secondary.TButton')
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        
         # Status bar with improved styling
         self.status_var = tk.StringVar()
         self.status_bar = ttk.Label(main_frame,
@@ -630,10 +879,14 @@ class DiskSchedulingSimulator:
         self.update_description()
 
     def start_simulation(self):
+        if self.task_running():
+            return
+
         try:
-            requests = list(map(int, self.entry_requests.get().split(',')))
+            requests, angles = split_positions(self.entry_requests.get().split(','))
             head = int(self.entry_head.get())
             algorithm = self.algorithm_var.get()
+            direction = self.direction_var.get()
             disk_size = int(self.entry_disk_size.get() or 200)
             
             if disk_size <= 0:
@@ -642,43 +895,35 @@ class DiskSchedulingSimulator:
             if any(r < 0 or r >= disk_size for r in requests):
                 raise ValueError(f"All requests must be between 0 and {disk_size-1}")
 
-            if algorithm == "FCFS":
-                sequence, total_seek_time = fcfs(requests.copy(), head)
-            elif algorithm == "SSTF":
-                sequence, total_seek_time = sstf(requests.copy(), head)
-            elif algorithm == "SCAN":
-                sequence, total_seek_time = scan(requests.copy(), head, self.direction_var.get(), disk_size)
-            elif algorithm == "C-SCAN":
-                sequence, total_seek_time = cscan(requests.copy(), head, self.direction_var.get(), disk_size)
-            elif algorithm == "LOOK":
-                sequence, total_seek_time = look(requests.copy(), head, self.direction_var.get(), disk_size)
-            elif algorithm == "C-LOOK":
-                sequence, total_seek_time = clook(requests.copy(), head, self.direction_var.get(), disk_size)
-            else:
+            if algorithm not in available(include_opt_in=True):
                 raise ValueError("Invalid algorithm selected")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            self.status_var.set("Error in simulation")
+            return
 
-            average_seek_time = total_seek_time / len(requests)
-            throughput = len(requests) / total_seek_time if total_seek_time != 0 else 0
+        def run(report, cancelled):
+            report(f"Running {algorithm} on {len(requests)} requests...")
+            return run_algorithm(algorithm, requests, head, direction, disk_size, angles=angles)
 
+        def done(result):
             result_text = (
                 f"Algorithm: {algorithm}\n"
-                f"Sequence: {sequence}\n"
-                f"Total Seek Time: {total_seek_time}\n"
-                f"Average Seek Time: {average_seek_time:.2f}\n"
-                f"Throughput: {throughput:.2f} requests per unit time\n"
+                f"Sequence: {result.format_sequence()}\n"
+                f"Total Seek Time: {result.total_seek_time}\n"
+                f"Average Seek Time: {result.average_seek_time:.2f}\n"
+                f"Throughput: {result.throughput:.2f} requests per unit time\n"
+                f"Modeled Time: {result.total_ms:.2f} ms ({result.iops:.1f} IOPS)\n"
                 f"Disk Size: {disk_size}"
             )
 
-            # Display results on window
+            # Display results on window; matplotlib has to run on the Tk thread
             self.result_label.config(text=result_text)
             self.status_var.set("Running animation...")
-            self.root.update()
-            animate_sequence(sequence, head, disk_size)
+            animate_sequence(result.sequence, head, disk_size)
             self.status_var.set("Simulation completed successfully")
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            self.status_var.set("Error in simulation")
+
+        self.run_task(run, done)
     
     def clear_fields(self):
         self.entry_requests.delete(0, tk.END)
@@ -0,0 +1,257 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+import numpy as np
+
+# Sequence positions shown on each line of the pager, and lines on screen
+PER_LINE = 10
+PAGE_LINES = 12
+DETAIL_LINES = 7
+MESSAGE_LINES = 25
+
+# (summary key, heading, format) for the per-algorithm table
+SUMMARY_COLUMNS = (
+    ("total_seek_time", "Total Seek", "{}"),
+    ("average_seek_time", "Avg Seek", "{:.2f}"),
+    ("total_ms", "Time (ms)", "{:.2f}"),
+    ("iops", "IOPS", "{:.1f}"),
+    ("max_wait", "Max Wait", "{}"),
+    ("turnarounds", "Turns", "{}"),
+)
+
+
+def format_lines(sequence, first_line, lines, per_line=PER_LINE, field=5):
+    """Text for `lines` pager lines of sequence starting at line first_line.
+
+    Each line starts with the index of its first position; only the
+    positions on those lines are read from the sequence.
+    """
+    start = first_line * per_line
+    stop = min(start + lines * per_line, len(sequence))
+    width = len(str(max(len(sequence) - 1, 0)))
+    text = []
+    for line_start in range(start, stop, per_line):
+        tracks = sequence[line_start:min(line_start + per_line, stop)]
+        text.append(f"{line_start:>{width}} | " + " ".join(f"{track:>{field}}" for track in tracks))
+    return "\n".join(text)
+
+
+def find_track(sequence, track, start=0):
+    """Index of the first visit to track at or after start, wrapping around
+    to the beginning; None when the track is never visited."""
+    view = np.frombuffer(sequence, dtype=np.intc)
+    for begin, end in ((start, len(view)), (0, min(start, len(view)))):
+        matches = view[begin:end] == track
+        if len(matches):
+            i = int(matches.argmax())
+            if matches[i]:
+                return begin + i
+    return None
+
+
+def format_request_metrics(summary):
+    edges = summary["seek_histogram"]["edges"]
+    counts = summary["seek_histogram"]["counts"]
+    # One text bar per histogram bin, scaled to the fullest bin
+    scale = 30 / max(max(counts), 1)
+    bars = "".join(
+        f"  {low:>6}-{high - 1:<6} {'#' * round(count * scale)} {count}\n"
+        for low, high, count in zip(edges, edges[1:], counts))
+    return (
+        f"Seek p50/p90/p99/max: {summary['seek_p50']:.1f} / {summary['seek_p90']:.1f} / "
+        f"{summary['seek_p99']:.1f} / {summary['seek_max']}\n"
+        f"Wait p50/p90/p99/max: {summary['wait_p50']:.1f} / {summary['wait_p90']:.1f} / "
+        f"{summary['wait_p99']:.1f} / {summary['wait_max']} tracks\n"
+        f"Variance: seek {summary['seek_variance']:.1f}, wait {summary['wait_variance']:.1f}\n"
+        f"Fairness (Jain): {summary['fairness']:.3f}\n"
+        f"Seek Distance Histogram:\n{bars}"
+    )
+
+
+class ResultsView(ttk.Frame):
+    """Comparison results as a summary table plus a paged sequence viewer.
+
+    The table has one row per algorithm; selecting a row shows its details
+    and its service sequence. The pager is virtual: its scrollbar spans the
+    whole sequence, but only the lines on screen are formatted into the Text
+    widget, so million-position sequences scroll as fast as short ones.
+    """
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.results = {}
+        self.sequence = ()
+        self.field = 5
+        self.first_line = 0
+        self.match = None
+        self.columnconfigure(0, weight=1)
+
+        # Summary table, one row per algorithm
+        columns = [key for key, _, _ in SUMMARY_COLUMNS]
+        self.table = ttk.Treeview(self, columns=columns, height=4, selectmode='browse')
+        self.table.heading('#0', text="Algorithm")
+        self.table.column('#0', width=90, stretch=False)
+        for key, heading, _ in SUMMARY_COLUMNS:
+            self.table.heading(key, text=heading)
+            self.table.column(key, width=75, anchor='e')
+        self.table.grid(row=0, column=0, columnspan=2, sticky='ew')
+        self.table.bind('<<TreeviewSelect>>', self.on_select)
+
+        # Details of the selected algorithm, or a plain message
+        self.details = tk.Text(self, height=DETAIL_LINES, wrap='word', state='disabled',
+                               bg='white', font=('Segoe UI', 10), relief='solid', padx=10, pady=5)
+        details_scroll = ttk.Scrollbar(self, orient='vertical', command=self.details.yview)
+        self.details.configure(yscrollcommand=details_scroll.set)
+        self.details.grid(row=1, column=0, sticky='ew', pady=(5, 0))
+        details_scroll.grid(row=1, column=1, sticky='ns', pady=(5, 0))
+
+        # Jump to an index or search for a track
+        controls = ttk.Frame(self)
+        controls.grid(row=2, column=0, columnspan=2, sticky='ew', pady=5)
+        ttk.Label(controls, text="Go to index:").pack(side=tk.LEFT)
+        self.index_entry = ttk.Entry(controls, width=10)
+        self.index_entry.pack(side=tk.LEFT, padx=(2, 2))
+        self.index_entry.bind('<Return>', lambda event: self.jump())
+        ttk.Button(controls, text="Go", command=self.jump, width=4).pack(side=tk.LEFT)
+        ttk.Label(controls, text="Find track:").pack(side=tk.LEFT, padx=(10, 0))
+        self.track_entry = ttk.Entry(controls, width=8)
+        self.track_entry.pack(side=tk.LEFT, padx=(2, 2))
+        self.track_entry.bind('<Return>', lambda event: self.find_next())
+        ttk.Button(controls, text="Find Next", command=self.find_next).pack(side=tk.LEFT)
+        self.position_var = tk.StringVar()
+        ttk.Label(controls, textvariable=self.position_var).pack(side=tk.RIGHT)
+
+        # Pager: the scrollbar is driven by hand instead of by the Text widget
+        self.pager = tk.Text(self, height=PAGE_LINES, wrap='none', state='disabled', bg='white',
+                             font=('Consolas', 10), relief='solid', padx=5, pady=5)
+        self.pager.tag_configure('match', background='#ffe08a')
+        self.pager_scroll = ttk.Scrollbar(self, orient='vertical', command=self.on_scroll)
+        self.pager.grid(row=3, column=0, sticky='nsew')
+        self.pager_scroll.grid(row=3, column=1, sticky='ns')
+        self.rowconfigure(3, weight=1)
+        for event_name in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.pager.bind(event_name, self.on_wheel)
+
+    def show_message(self, text):
+        """Replace the results with a plain text message."""
+        self.results = {}
+        self.table.delete(*self.table.get_children())
+        # Messages such as the array report get more room than the details
+        self.details.config(height=min(max(text.count("\n") + 1, DETAIL_LINES), MESSAGE_LINES))
+        self.set_details(text)
+        self.set_sequence(())
+
+    def show_results(self, results):
+        """Show a dict of algorithm -> ScheduleResult; the first one is selected."""
+        self.results = results
+        self.table.delete(*self.table.get_children())
+        self.table.config(height=max(1, min(len(results), 8)))
+        for algo, result in results.items():
+            summary = result.summary()
+            self.table.insert('', tk.END, iid=algo, text=algo, values=[
+                "-" if summary[key] is None else fmt.format(summary[key])
+                for key, _, fmt in SUMMARY_COLUMNS])
+        if results:
+            self.table.selection_set(next(iter(results)))
+        else:
+            self.show_message("No results")
+
+    def on_select(self, event=None):
+        selection = self.table.selection()
+        if not selection:
+            return
+        algo = selection[0]
+        result = self.results[algo]
+        details = (f"{algo}: {len(result):,} positions, {len(result.turnarounds):,} turnarounds, "
+                   f"max wait {result.max_wait} places behind arrival order")
+        if result.deadline_misses is not None:
+            details += f", {result.deadline_misses:,} deadline misses"
+        details += "\n"
+        if result.request_metrics is not None:
+            details += format_request_metrics(result.request_metrics.summary())
+        self.details.config(height=DETAIL_LINES)
+        self.set_details(details)
+        self.set_sequence(result.sequence)
+
+    def set_details(self, text):
+        self.details.config(state='normal')
+        self.details.delete('1.0', tk.END)
+        self.details.insert(tk.END, text)
+        self.details.config(state='disabled')
+
+    def set_sequence(self, sequence):
+        self.sequence = sequence
+        self.match = None
+        top = int(np.frombuffer(sequence, dtype=np.intc).max()) if len(sequence) else 0
+        self.field = max(5, len(str(top)))
+        self.show_line(0)
+
+    def line_count(self):
+        return -(-len(self.sequence) // PER_LINE)
+
+    def show_line(self, first_line):
+        """Render the page starting at first_line, clamped to the sequence."""
+        total = self.line_count()
+        self.first_line = max(0, min(first_line, total - PAGE_LINES))
+        self.pager.config(state='normal')
+        self.pager.delete('1.0', tk.END)
+        self.pager.insert(tk.END, format_lines(self.sequence, self.first_line, PAGE_LINES,
+                                               PER_LINE, self.field))
+        if self.match is not None:
+            line = self.match // PER_LINE - self.first_line
+            if 0 <= line < PAGE_LINES:
+                prefix = len(str(max(len(self.sequence) - 1, 0))) + 3
+                column = prefix + self.match % PER_LINE * (self.field + 1)
+                self.pager.tag_add('match', f"{line + 1}.{column}",
+                                   f"{line + 1}.{column + self.field}")
+        self.pager.config(state='disabled')
+
+        if total:
+            self.pager_scroll.set(self.first_line / total,
+                                  min(self.first_line + PAGE_LINES, total) / total)
+            first = self.first_line * PER_LINE
+            last = min(first + PAGE_LINES * PER_LINE, len(self.sequence)) - 1
+            self.position_var.set(f"Positions {first:,}-{last:,} of {len(self.sequence):,}")
+        else:
+            self.pager_scroll.set(0, 1)
+            self.position_var.set("")
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.show_line(int(float(amount) * self.line_count()))
+        elif action == 'scroll':
+            step = PAGE_LINES if unit == 'pages' else 1
+            self.show_line(self.first_line + int(amount) * step)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.show_line(self.first_line - 3)
+        else:
+            self.show_line(self.first_line + 3)
+        return 'break'
+
+    def jump(self):
+        try:
+            index = int(self.index_entry.get())
+            if not 0 <= index < len(self.sequence):
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Invalid Index",
+                                 f"Enter an index between 0 and {max(len(self.sequence) - 1, 0)}.")
+            return
+        self.match = index
+        self.show_line(index // PER_LINE - PAGE_LINES // 2)
+
+    def find_next(self):
+        try:
+            track = int(self.track_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Track", "Enter a track number to search for.")
+            return
+        start = 0 if self.match is None else self.match + 1
+        index = find_track(self.sequence, track, start) if len(self.sequence) else None
+        if index is None:
+            self.position_var.set(f"Track {track} is not in the sequence")
+            return
+        self.match = index
+        self.show_line(index // PER_LINE - PAGE_LINES // 2)
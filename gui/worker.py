@@ -0,0 +1,78 @@
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a task once cancel() has been requested."""
+
+
+class BackgroundTask:
+    """Run a function on a worker thread and report back on the Tk thread.
+
+    `func` is called as func(report, cancelled): report(message) queues a
+    progress message and cancelled is a threading.Event the function should
+    check between steps, raising Cancelled when it is set. Tk is only touched
+    from the main thread, by polling the queue with root.after.
+    """
+
+    def __init__(self, root, func, on_done, on_error=None, on_progress=None,
+                 on_cancel=None, poll_ms=50):
+        self.root = root
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.poll_ms = poll_ms
+        self.cancelled = threading.Event()
+        self.messages = queue.Queue()
+        self.thread = None
+        self._running = False
+
+    @property
+    def running(self):
+        # Cleared by _poll when the final message is delivered, not when the
+        # thread exits, so a new task cannot start before on_done has run
+        return self._running
+
+    def start(self):
+        self._running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self.root.after(self.poll_ms, self._poll)
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _run(self):
+        try:
+            result = self.func(lambda message: self.messages.put(("progress", message)),
+                               self.cancelled)
+            if self.cancelled.is_set():
+                raise Cancelled()
+            self.messages.put(("done", result))
+        except Cancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            self.messages.put(("error", e))
+
+    def _poll(self):
+        while True:
+            try:
+                kind, value = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self.on_progress:
+                    self.on_progress(value)
+            else:
+                self._running = False
+                if kind == "done":
+                    self.on_done(value)
+                elif kind == "error" and self.on_error:
+                    self.on_error(value)
+                elif kind == "cancelled" and self.on_cancel:
+                    self.on_cancel()
+                return
+        self.root.after(self.poll_ms, self._poll)
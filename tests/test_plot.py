@@ -0,0 +1,37 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.registry import available, get_scheduler
+from visualization.plot import add_turnaround_point
+
+
+def check(sequence, head, disk_size):
+    expected = add_turnaround_point(list(sequence), head, disk_size)
+    result = add_turnaround_point(np.array(sequence, dtype=np.int64), head, disk_size)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == expected
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_array_matches_list_on_random_sequences(seed):
+    rng = random.Random(seed)
+    disk_size = rng.choice([1, 2, 5, 20, 200])
+    end = disk_size - 1
+    # Paths that revisit tracks and touch both ends turn in every way
+    sequence = [rng.choice([0, end, rng.randrange(disk_size)])
+                for _ in range(rng.randint(0, 25))]
+    head = rng.choice([0, end, rng.randrange(disk_size)])
+    check(sequence, head, disk_size)
+
+
+@pytest.mark.parametrize("direction", ["right", "left"])
+@pytest.mark.parametrize("seed", range(20))
+def test_array_matches_list_on_scheduler_output(seed, direction):
+    rng = random.Random(seed)
+    requests = [rng.randrange(200) for _ in range(rng.randint(1, 30))]
+    head = rng.randrange(200)
+    for algo in available():
+        sequence, _ = get_scheduler(algo).run(requests, head, direction, 200)
+        check(sequence, head, 200)
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from core.sstf import prepare_sstf, sstf_prepared
+
+
+def quadratic_sstf(requests, head):
+    # The original O(n^2) SSTF: min() keeps the request that comes first in
+    # the queue when two are equally close.
+    total_seek_time = 0
+    sequence = []
+    requests = requests.copy()
+    while requests:
+        nearest = min(requests, key=lambda x: abs(x - head))
+        total_seek_time += abs(head - nearest)
+        sequence.append(nearest)
+        head = nearest
+        requests.remove(nearest)
+    return sequence, total_seek_time
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_quadratic_sstf(seed):
+    rng = random.Random(seed)
+    # A narrow disk gives repeated tracks and equal-distance ties
+    disk_size = rng.choice([1, 2, 5, 10, 30])
+    requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 40))]
+    head = rng.randrange(disk_size)
+    assert sstf_prepared(prepare_sstf(requests), head) == quadratic_sstf(requests, head)
+
+
+@pytest.mark.parametrize("requests, head", [
+    ([40, 60], 50),
+    ([60, 40], 50),
+    ([60, 40, 40, 60], 50),
+    ([50, 50, 10], 50),
+    ([], 0),
+])
+def test_ties_follow_queue_order(requests, head):
+    assert sstf_prepared(prepare_sstf(requests), head) == quadratic_sstf(requests, head)
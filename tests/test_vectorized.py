@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.clook import clook
+from core.cscan import cscan
+from core.fcfs import fcfs
+from core.look import look
+from core.scan import scan
+from core.vectorized import clook_array, cscan_array, fcfs_array, look_array, scan_array
+
+SWEEPS = [(scan, scan_array), (cscan, cscan_array), (look, look_array), (clook, clook_array)]
+EDGES = [(scan, scan_array), (cscan, cscan_array)]
+
+
+def random_case(seed):
+    rng = random.Random(seed)
+    disk_size = rng.choice([1, 2, 5, 50, 200])
+    end = disk_size - 1
+    requests = [rng.randrange(disk_size) for _ in range(rng.randint(0, 30))]
+    # Requests on the disk edges and on the head itself change where SCAN turns
+    requests += rng.sample([0, end, end, 0], rng.randint(0, 4))
+    rng.shuffle(requests)
+    head = rng.choice([0, end, rng.randrange(disk_size)])
+    return requests, head, disk_size
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_fcfs_array_matches_fcfs(seed):
+    requests, head, _ = random_case(seed)
+    sequence, total = fcfs_array(np.array(requests, dtype=np.int64), head)
+    assert (sequence.tolist(), total) == fcfs(requests, head)
+
+
+@pytest.mark.parametrize("direction", ["right", "left"])
+@pytest.mark.parametrize("function, array_function", SWEEPS)
+@pytest.mark.parametrize("seed", range(100))
+def test_sweep_arrays_match_lists(seed, function, array_function, direction):
+    requests, head, disk_size = random_case(seed)
+    expected = function(requests, head, direction, disk_size)
+    for dtype in (np.int32, np.int64):
+        sequence, total = array_function(np.array(requests, dtype=dtype), head, direction,
+                                         disk_size)
+        assert (sequence.tolist(), total) == expected
+
+    # The same on an already sorted array
+    requests_sorted = np.sort(np.array(requests, dtype=np.int64))
+    sequence, total = array_function(requests_sorted, head, direction, disk_size,
+                                     assume_sorted=True)
+    assert (sequence.tolist(), total) == expected
+
+
+@pytest.mark.parametrize("direction", ["right", "left"])
+@pytest.mark.parametrize("function, array_function", EDGES)
+@pytest.mark.parametrize("seed", range(100))
+def test_edge_points_match_lists(seed, function, array_function, direction):
+    requests, head, disk_size = random_case(seed)
+    edges = []
+    array_edges = []
+    function(requests, head, direction, disk_size, edges=edges)
+    array_function(np.array(requests, dtype=np.int64), head, direction, disk_size,
+                   edges=array_edges)
+    assert array_edges == edges
@@ -0,0 +1,115 @@
+import argparse
+import struct
+
+import numpy as np
+
+# Columnar trace file:
+#   64 byte header: magic, version, count, disk_size (little endian)
+#   float64[count] arrival times
+#   int32[count]   track numbers
+# Both columns are 8-byte aligned so they can be mapped straight into NumPy.
+# Files use the .dst extension, which is how cli.py recognises them.
+
+MAGIC = b"DSTRACE1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ32x")
+ARRIVAL_DTYPE = np.dtype("<f8")
+TRACK_DTYPE = np.dtype("<i4")
+
+
+class MappedTrace:
+    """A columnar trace opened read-only through numpy.memmap."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a columnar trace")
+        magic, version, _, count, disk_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a columnar trace")
+        if version != VERSION:
+            raise ValueError(f"{path} has unsupported trace version {version}")
+
+        self.trace_path = path
+        self.disk_size = disk_size
+        if count:
+            self.arrivals = np.memmap(path, dtype=ARRIVAL_DTYPE, mode="r",
+                                      offset=HEADER.size, shape=(count,))
+            self.tracks = np.memmap(path, dtype=TRACK_DTYPE, mode="r",
+                                    offset=HEADER.size + count * ARRIVAL_DTYPE.itemsize,
+                                    shape=(count,))
+        else:
+            # np.memmap refuses zero-length maps
+            self.arrivals = np.empty(0, dtype=ARRIVAL_DTYPE)
+            self.tracks = np.empty(0, dtype=TRACK_DTYPE)
+
+    def __len__(self):
+        return len(self.tracks)
+
+    def __iter__(self):
+        return iter(self.tracks.tolist())
+
+    def __getitem__(self, index):
+        return self.tracks[index]
+
+    def arrival_stream(self):
+        """Yield (arrival_time, track) pairs for event_sim.simulate."""
+        return zip(self.arrivals.tolist(), self.tracks.tolist())
+
+
+def open_trace(path):
+    return MappedTrace(path)
+
+
+def write_trace(path, tracks, arrivals=None, disk_size=200):
+    if disk_size <= 0:
+        raise ValueError("disk_size must be positive")
+    tracks = np.asarray(tracks, dtype=np.int64)
+    if len(tracks) and (tracks.min() < 0 or tracks.max() >= disk_size):
+        raise ValueError(f"All requests must be between 0 and {disk_size-1}")
+    tracks = tracks.astype(TRACK_DTYPE)
+    if arrivals is None:
+        arrivals = np.zeros(len(tracks), dtype=ARRIVAL_DTYPE)
+    else:
+        arrivals = np.asarray(arrivals, dtype=ARRIVAL_DTYPE)
+    if arrivals.shape != tracks.shape:
+        raise ValueError("arrivals and tracks must be the same length")
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(tracks), disk_size))
+        arrivals.tofile(f)
+        tracks.tofile(f)
+
+
+def convert_requests(text, path, disk_size=200, interval=0.0):
+    """Write comma separated requests, as typed into the GUI, as a columnar trace.
+
+    Requests are given arrival times 0, interval, 2*interval, ...
+    """
+    tracks = np.array(text.replace(",", " ").split(), dtype=np.int64)
+    arrivals = np.arange(len(tracks), dtype=ARRIVAL_DTYPE) * interval
+    write_trace(path, tracks, arrivals, disk_size)
+    return len(tracks)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert comma separated requests to a columnar trace file.")
+    parser.add_argument("source", help="text file of comma separated requests")
+    parser.add_argument("output", help="columnar trace to write")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--interval", type=float, default=0.0,
+                        help="time between consecutive arrivals (default: all at 0)")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.source) as f:
+            count = convert_requests(f.read(), args.output, args.disk_size, args.interval)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Wrote {count} requests to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import csv
+import os
+import struct
+from array import array
+
+from core.cost import DEFAULT_MODEL, iops
+from core.metrics import max_delay, seek_metrics
+from core.registry import get_scheduler
+
+# Every reader is a generator of (timestamp, sector) pairs that reads its
+# file a line or a block at a time, so a trace is never held in memory.
+
+SECTOR_SIZE = 512
+BINARY_RECORD = struct.Struct("<dq")  # float64 timestamp, int64 sector
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def read_blkparse(path, actions=("D",)):
+    """Read default blkparse output, keeping only the given action codes.
+
+    A line looks like "8,0  3  1  0.000000000  697  D  WS 223490 + 8 [jbd2]";
+    summary lines and actions not in `actions` are skipped.
+    """
+    with open(path) as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) < 8 or fields[5] not in actions:
+                continue
+            try:
+                yield float(fields[3]), int(fields[7])
+            except ValueError:
+                continue
+
+
+def read_csv(path, time_field="timestamp", sector_field="sector", offset_field="offset",
+             sector_size=SECTOR_SIZE):
+    """Read a CSV trace with a header row.
+
+    Uses the sector column when present, otherwise converts the byte offset
+    column to sectors. A missing timestamp column reads as time 0.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = [name.strip().lower() for name in next(reader, [])]
+        if sector_field in header:
+            column, scale = header.index(sector_field), 1
+        elif offset_field in header:
+            column, scale = header.index(offset_field), sector_size
+        else:
+            raise ValueError(f"CSV trace needs a '{sector_field}' or '{offset_field}' column")
+        time_column = header.index(time_field) if time_field in header else None
+
+        for row in reader:
+            if not row:
+                continue
+            timestamp = float(row[time_column]) if time_column is not None else 0.0
+            yield timestamp, int(row[column]) // scale
+
+
+def read_binary(path, block_records=DEFAULT_CHUNK_SIZE):
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(BINARY_RECORD.size * block_records)
+            if not block:
+                break
+            if len(block) % BINARY_RECORD.size:
+                raise ValueError(f"{path} is truncated")
+            yield from BINARY_RECORD.iter_unpack(block)
+
+
+def write_binary(records, path):
+    with open(path, "wb") as f:
+        for timestamp, sector in records:
+            f.write(BINARY_RECORD.pack(timestamp, sector))
+
+
+READERS = {
+    "blkparse": read_blkparse,
+    "csv": read_csv,
+    "binary": read_binary,
+}
+
+
+def guess_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".bin", ".dat"):
+        return "binary"
+    return "blkparse"
+
+
+def read_trace(path, fmt=None):
+    return READERS[fmt or guess_format(path)](path)
+
+
+def max_sector(records):
+    return max((sector for _, sector in records), default=0)
+
+
+def lba_to_track(sector, disk_size, max_sector):
+    return min(sector * disk_size // (max_sector + 1), disk_size - 1)
+
+
+def iter_arrivals(records, disk_size, max_sector):
+    """Map (timestamp, sector) records to (timestamp, track) for simulate()."""
+    for timestamp, sector in records:
+        yield timestamp, lba_to_track(sector, disk_size, max_sector)
+
+
+def iter_chunks(records, disk_size, max_sector, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield (timestamps, tracks) arrays of at most chunk_size requests."""
+    times = array("d")
+    tracks = array("q")
+    for timestamp, sector in records:
+        times.append(timestamp)
+        tracks.append(lba_to_track(sector, disk_size, max_sector))
+        if len(tracks) >= chunk_size:
+            yield times, tracks
+            times = array("d")
+            tracks = array("q")
+    if tracks:
+        yield times, tracks
+
+
+def schedule_chunks(chunks, algorithm, head, direction="right", disk_size=200, model=None):
+    """Run a core scheduler over each chunk in turn, carrying the head across.
+
+    Each chunk is scheduled as one queue, which models a device that sees at
+    most chunk_size outstanding requests. Only totals are kept; returns
+    (request_count, total_seek_time, average_seek_time, throughput, total_ms, iops,
+    max_wait), where max_wait is measured within each chunk.
+    """
+    scheduler = get_scheduler(algorithm)
+    model = model or DEFAULT_MODEL
+    count = 0
+    total_seek_time = 0
+    total_ms = 0.0
+    max_wait = 0
+    for _, tracks in chunks:
+        edges = []
+        sequence, seek = scheduler.run(tracks, head, direction, disk_size, edges=edges)
+        total_seek_time += seek
+        total_ms += model.total_time(sequence, head, len(tracks))
+        max_wait = max(max_wait, max_delay(tracks, sequence, edges))
+        count += len(tracks)
+        if sequence:
+            head = sequence[-1]
+    return ((count, total_seek_time) + seek_metrics(count, total_seek_time)
+            + (total_ms, iops(count, total_ms), max_wait))
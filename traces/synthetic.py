@@ -0,0 +1,236 @@
+import argparse
+
+import numpy as np
+
+from traces.columnar import ARRIVAL_DTYPE, HEADER, MAGIC, TRACK_DTYPE, VERSION
+
+# Seeded synthetic workloads. Every generator yields NumPy blocks of at most
+# BLOCK requests and carries its state between blocks, so a workload of any
+# size is built (or streamed to a trace file) without Python loops over
+# requests. Tracks, arrival times and read/write flags come from independent
+# streams of the same seed: changing the arrival process or the write ratio
+# leaves the track sequence unchanged.
+
+BLOCK = 1 << 20
+
+
+def _block_sizes(n):
+    for start in range(0, n, BLOCK):
+        yield min(BLOCK, n - start)
+
+
+def uniform(rng, n, disk_size):
+    for size in _block_sizes(n):
+        yield rng.integers(0, disk_size, size, dtype=TRACK_DTYPE)
+
+
+def hotspot(rng, n, disk_size, centres=None, spread=0.05, hot_fraction=0.9):
+    """Gaussian hot spots over a uniform background.
+
+    centres defaults to a quarter and three quarters of the disk; spread is
+    the standard deviation as a fraction of the disk and hot_fraction the
+    share of requests that go to a hot spot.
+    """
+    if centres is None:
+        centres = [disk_size // 4, 3 * disk_size // 4]
+    centres = np.asarray(centres, dtype=float)
+    sigma = spread * disk_size
+    for size in _block_sizes(n):
+        tracks = centres[rng.integers(0, len(centres), size)]
+        tracks += rng.standard_normal(size) * sigma
+        if hot_fraction < 1:
+            background = rng.random(size) >= hot_fraction
+            tracks[background] = rng.integers(0, disk_size, int(background.sum()))
+        yield np.clip(tracks, 0, disk_size - 1).astype(TRACK_DTYPE)
+
+
+def zipf(rng, n, disk_size, a=1.2):
+    """Zipf popularity over every track: the k-th hottest gets weight 1 / k**a.
+
+    Hot tracks are scattered over the disk by a random permutation. Ranks
+    are drawn by inverse CDF through a guide table, which answers most draws
+    with one lookup and leaves a binary search only for the rest.
+    """
+    cdf = np.cumsum(np.arange(1, disk_size + 1, dtype=float) ** -a)
+    cdf /= cdf[-1]
+    buckets = max(1 << 16, 4 * disk_size)
+    edges = np.arange(buckets + 1) / buckets
+    low = np.searchsorted(cdf, edges[:-1], side="right")
+    exact = low == np.searchsorted(cdf, edges[1:], side="left")
+    low = np.minimum(low, disk_size - 1)
+    tracks = rng.permutation(disk_size).astype(TRACK_DTYPE)
+    for size in _block_sizes(n):
+        u = rng.random(size)
+        bucket = (u * buckets).astype(np.intp)
+        ranks = low[bucket]
+        search = np.flatnonzero(~exact[bucket])
+        ranks[search] = np.minimum(np.searchsorted(cdf, u[search], side="right"), disk_size - 1)
+        yield tracks[ranks]
+
+
+def sequential(rng, n, disk_size, jump_probability=1 / 64):
+    """Runs of consecutive tracks; each request jumps to a random track with
+    jump_probability, so runs are 1 / jump_probability long on average."""
+    following = None  # track after the last one of the previous block
+    for size in _block_sizes(n):
+        index = np.arange(size)
+        jumps = rng.random(size) < jump_probability
+        if following is None:
+            jumps[0] = True
+        starts = np.zeros(size, dtype=np.int64)
+        starts[jumps] = rng.integers(0, disk_size, int(jumps.sum()))
+        run_start = np.maximum.accumulate(np.where(jumps, index, -1))
+        # Requests before the first jump continue the previous block's run
+        tracks = np.where(run_start >= 0, starts[np.maximum(run_start, 0)] + index - run_start,
+                          (following or 0) + index)
+        tracks %= disk_size
+        following = int(tracks[-1]) + 1
+        yield tracks.astype(TRACK_DTYPE)
+
+
+PATTERNS = {
+    "uniform": uniform,
+    "hotspot": hotspot,
+    "zipf": zipf,
+    "sequential": sequential,
+}
+
+
+def poisson(rng, n, rate=1.0):
+    """Arrival times of a Poisson process with `rate` requests per time unit."""
+    now = 0.0
+    for size in _block_sizes(n):
+        times = np.cumsum(rng.standard_exponential(size) / rate)
+        times += now
+        now = float(times[-1])
+        yield times
+
+
+def bursty(rng, n, rate=1.0, burst_length=32, intensity=10.0):
+    """Bursts of back-to-back arrivals separated by idle gaps.
+
+    Bursts hold burst_length requests on average and arrive intensity times
+    faster than `rate` inside a burst; the idle gaps are sized so the long
+    run average is still `rate`.
+    """
+    new_burst = 1 / burst_length
+    burst_gap = 1 / (rate * intensity)
+    idle_gap = (1 / rate - (1 - new_burst) * burst_gap) / new_burst
+    now = 0.0
+    for size in _block_sizes(n):
+        gaps = np.where(rng.random(size) < new_burst, idle_gap, burst_gap)
+        gaps *= rng.standard_exponential(size)
+        times = np.cumsum(gaps)
+        times += now
+        now = float(times[-1])
+        yield times
+
+
+ARRIVALS = {
+    "poisson": poisson,
+    "bursty": bursty,
+}
+
+
+def write_flags(rng, n, write_ratio):
+    for size in _block_sizes(n):
+        yield rng.random(size) < write_ratio
+
+
+def write_mix(n, write_ratio, seed=0):
+    """Bool array marking about write_ratio of n requests as writes.
+
+    Drawn from the same stream as generate(), so for the same seed and ratio
+    it equals generate()'s writes whatever the track pattern.
+    """
+    if not 0 <= write_ratio <= 1:
+        raise ValueError("Write ratio must be between 0 and 1")
+    return _collect(write_flags(_streams(seed)[2], n, write_ratio), n, bool)
+
+
+def _streams(seed):
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(3)]
+
+
+def _collect(blocks, n, dtype):
+    out = np.empty(n, dtype=dtype)
+    start = 0
+    for block in blocks:
+        out[start:start + len(block)] = block
+        start += len(block)
+    return out
+
+
+def generate(n, pattern="uniform", disk_size=200, seed=0, arrival=None, rate=1.0,
+             write_ratio=0.0, **params):
+    """Return (tracks, arrivals, writes) arrays for n synthetic requests.
+
+    tracks are int32 in [0, disk_size). arrivals is None for a static queue,
+    otherwise float64 times from one of ARRIVALS at `rate`. writes is None
+    when write_ratio is 0, otherwise a bool array with that share of writes.
+    Extra keyword arguments go to the track pattern.
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown pattern {pattern!r} (choose from {', '.join(PATTERNS)})")
+    if arrival is not None and arrival not in ARRIVALS:
+        raise ValueError(f"Unknown arrival process {arrival!r} (choose from {', '.join(ARRIVALS)})")
+    if disk_size <= 0:
+        raise ValueError("Disk size must be positive")
+    track_rng, arrival_rng, write_rng = _streams(seed)
+    tracks = _collect(PATTERNS[pattern](track_rng, n, disk_size, **params), n, TRACK_DTYPE)
+    arrivals = writes = None
+    if arrival is not None:
+        arrivals = _collect(ARRIVALS[arrival](arrival_rng, n, rate), n, ARRIVAL_DTYPE)
+    if write_ratio:
+        writes = _collect(write_flags(write_rng, n, write_ratio), n, bool)
+    return tracks, arrivals, writes
+
+
+def write_workload(path, n, pattern="uniform", disk_size=200, seed=0, arrival=None, rate=1.0,
+                   **params):
+    """Stream a synthetic workload into a columnar trace (.dst) block by block.
+
+    Produces the same tracks and arrivals as generate() with the same
+    arguments; the format has no read/write column. Without an arrival
+    process every request arrives at time 0.
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown pattern {pattern!r} (choose from {', '.join(PATTERNS)})")
+    if arrival is not None and arrival not in ARRIVALS:
+        raise ValueError(f"Unknown arrival process {arrival!r} (choose from {', '.join(ARRIVALS)})")
+    track_rng, arrival_rng, _ = _streams(seed)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, n, disk_size))
+        if arrival is None:
+            for size in _block_sizes(n):
+                np.zeros(size, dtype=ARRIVAL_DTYPE).tofile(f)
+        else:
+            for block in ARRIVALS[arrival](arrival_rng, n, rate):
+                block.astype(ARRIVAL_DTYPE, copy=False).tofile(f)
+        for block in PATTERNS[pattern](track_rng, n, disk_size, **params):
+            block.astype(TRACK_DTYPE, copy=False).tofile(f)
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic workload as a columnar trace.")
+    parser.add_argument("output", help="columnar trace to write (.dst)")
+    parser.add_argument("-n", "--requests", type=int, required=True)
+    parser.add_argument("--pattern", choices=list(PATTERNS), default="uniform")
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival", choices=list(ARRIVALS),
+                        help="arrival process (default: every request at time 0)")
+    parser.add_argument("--rate", type=float, default=1.0, help="mean arrivals per time unit")
+    args = parser.parse_args(argv)
+
+    try:
+        count = write_workload(args.output, args.requests, args.pattern, args.disk_size,
+                               args.seed, args.arrival, args.rate)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Wrote {count} requests to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
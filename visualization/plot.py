@@ -1,32 +1,150 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.animation import FuncAnimation
+from matplotlib.ticker import MaxNLocator
+
+# Sequences up to this length animate one request per frame at 500 ms;
+# longer ones are decimated to at most MAX_FPS frames per second.
+SHORT_SEQUENCE = 100
+MAX_FPS = 30
+DEFAULT_DURATION = 10  # seconds
 
 def add_turnaround_point(sequence, head, disk_size=200):
+    """Insert the disk ends the head reverses at into `sequence`.
+
+    Runs in one pass, tracking whether each end has been visited instead of
+    searching the path built so far. NumPy arrays take a vectorized path and
+    return an array.
+    """
+    if isinstance(sequence, np.ndarray):
+        return _add_turnaround_array(sequence, head, disk_size)
+    if len(sequence) == 0:
+        return [head]
+
+    end = disk_size - 1
     modified_seq = [head]
-    
+    seen_end = head == end
+    seen_zero = head == 0
+    prev = head
+
     for i in range(len(sequence) - 1):
         curr = sequence[i]
         next_ = sequence[i + 1]
         modified_seq.append(curr)
+        seen_end = seen_end or curr == end
+        seen_zero = seen_zero or curr == 0
 
         # Detect direction change
-        if (next_ - curr) * (curr - modified_seq[-2]) < 0:
-            if curr < next_ and (disk_size - 1) not in modified_seq:
-                modified_seq.append(disk_size - 1)
-            elif curr > next_ and 0 not in modified_seq:
+        if (next_ - curr) * (curr - prev) < 0:
+            if curr < next_ and not seen_end:
+                modified_seq.append(end)
+                seen_end = True
+                prev = end
+                continue
+            elif curr > next_ and not seen_zero:
                 modified_seq.append(0)
+                seen_zero = True
+                prev = 0
+                continue
+        prev = curr
 
     modified_seq.append(sequence[-1])
-    
+    seen_end = seen_end or sequence[-1] == end
+    seen_zero = seen_zero or sequence[-1] == 0
+
     # Additional check: if it's SCAN or C-SCAN but didn't reach end/start
-    if sequence[0] > head and (0 not in sequence and 0 not in modified_seq):
+    if sequence[0] > head and not seen_zero:
         modified_seq.insert(1, 0)
-    elif sequence[0] < head and ((disk_size - 1) not in sequence and (disk_size - 1) not in modified_seq):
-        modified_seq.insert(1, disk_size - 1)
-    
+    elif sequence[0] < head and not seen_end:
+        modified_seq.insert(1, end)
+
     return modified_seq
+
+
+def _add_turnaround_array(sequence, head, disk_size):
+    sequence = np.asarray(sequence, dtype=np.int64)
+    count = len(sequence)
+    if count == 0:
+        return np.array([head], dtype=np.int64)
+
+    end = disk_size - 1
+    path = np.concatenate(([head], sequence))
+    step = np.sign(np.diff(path))
+    # Entry i describes sequence[i] with sequence[i + 1] as the next request
+    turn = step[1:] * step[:-1] < 0
+    rising = step[1:] > 0
+    seen_end = np.logical_or.accumulate(path[1:count] == end) | (head == end)
+    seen_zero = np.logical_or.accumulate(path[1:count] == 0) | (head == 0)
+
+    # Each end is inserted at most once, so there are at most two inserts.
+    # An insert changes the previous position for the request right after
+    # it, so that one turn is re-evaluated before looking further.
+    inserts = []
+    need_end = need_zero = True
+    pos = 0
+    while pos < count - 1 and (need_end or need_zero):
+        candidates = np.zeros(count - 1 - pos, dtype=bool)
+        if need_end:
+            candidates |= turn[pos:] & rising[pos:] & ~seen_end[pos:]
+        if need_zero:
+            candidates |= turn[pos:] & ~rising[pos:] & ~seen_zero[pos:]
+        hits = np.flatnonzero(candidates)
+        if not len(hits):
+            break
+
+        k = pos + hits[0]
+        boundary = end if rising[k] else 0
+        inserts.append((k, boundary))
+        if boundary == end:
+            need_end = False
+        else:
+            need_zero = False
+        if k + 1 < count - 1:
+            turn[k + 1] = (np.sign(sequence[k + 2] - sequence[k + 1])
+                           * np.sign(sequence[k + 1] - boundary)) < 0
+        pos = k + 1
+
+    modified_seq = np.insert(path, [k + 2 for k, _ in inserts], [b for _, b in inserts])
+
+    has_zero = head == 0 or not need_zero or bool((sequence == 0).any())
+    has_end = head == end or not need_end or bool((sequence == end).any())
+    if sequence[0] > head and not has_zero:
+        modified_seq = np.insert(modified_seq, 1, 0)
+    elif sequence[0] < head and not has_end:
+        modified_seq = np.insert(modified_seq, 1, end)
+
+    return modified_seq
+
+
 # Animation function
-def animate_sequence(sequence, head, disk_size=200):
+def animate_sequence(sequence, head, disk_size=200, frame_step=None, duration=None, max_ticks=30):
+    """Animate the head moving through `sequence`.
+
+    Short sequences step one request per frame every 500 ms. Longer ones are
+    decimated: frame_step requests are drawn per frame (chosen automatically
+    when not given) so the whole run takes about `duration` seconds.
+    """
+    count = len(sequence)
+
+    # Preallocated path: index 0 is the starting head at y=-1, request i is
+    # drawn at y=i. Frames hand out views of these arrays instead of copies.
+    x_data = np.empty(count + 1, dtype=float)
+    x_data[0] = head
+    x_data[1:] = sequence
+    y_data = np.arange(-1, count, dtype=float)
+
+    if frame_step is None:
+        if duration is None and count <= SHORT_SEQUENCE:
+            frame_step = 1
+        else:
+            frames_wanted = int((duration or DEFAULT_DURATION) * MAX_FPS)
+            frame_step = max(1, -(-count // max(frames_wanted, 1)))
+    frames = -(-count // frame_step) + 1  # +1 to include initial position
+    if duration is None:
+        interval = 500 if frame_step == 1 and count <= SHORT_SEQUENCE else 1000 / MAX_FPS
+    else:
+        interval = duration * 1000 / frames
+
     fig, ax = plt.subplots(figsize=(10, 6))
 
     # Optional: Position the animation window to the right
@@ -38,52 +156,45 @@ def animate_sequence(sequence, head, disk_size=200):
     except:
         pass  # For non-GUI environments
 
-    # Create the line plot starting from head position
-    line, = ax.plot([head], [-1], 'b-o', label="Disk Head Movement")  # Start at y=-1
+    # Markers on every point only help while they can still be told apart
+    style = 'b-o' if count <= SHORT_SEQUENCE else 'b-'
+    line, = ax.plot(x_data[:1], y_data[:1], style, label="Disk Head Movement")  # Start at y=-1
     current_point = ax.scatter([], [], color='r', s=100, label="Current Position")
     initial_point = ax.scatter([head], [-1], color='g', s=100, label="Initial Position")  # Position at y=-1
 
-    # Get unique points from sequence for x-axis ticks
-    unique_points = sorted(set(sequence + [head]))
-    
     ax.set_title(f"Disk Head Movement Animation (Disk Size: {disk_size})")
     ax.set_xlabel("Track Position")
     ax.set_xlim(0, disk_size)
-    ax.set_ylim(-1.5, len(sequence) - 0.5)  # Extend y-axis to show initial position
+    ax.set_ylim(-1.5, count - 0.5)  # Extend y-axis to show initial position
     ax.invert_yaxis()
     ax.grid(True, linestyle='--', alpha=0.7)
     ax.legend()
-    
-    # Set x-axis ticks to only show the points that are actually used
-    ax.set_xticks(unique_points)
-    ax.set_xticklabels(unique_points, rotation=45)  # Rotate labels for better readability
-    
+
+    # Label the tracks actually visited while there are few of them,
+    # otherwise fall back to a thinned, evenly spaced set of ticks
+    unique_points = np.unique(x_data)
+    if len(unique_points) <= max_ticks:
+        ax.set_xticks(unique_points)
+        ax.set_xticklabels([f"{p:g}" for p in unique_points], rotation=45)  # Rotate labels for better readability
+    else:
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=max_ticks, integer=True))
+        ax.tick_params(axis='x', labelrotation=45)
+
     # Move x-axis to top and hide y-axis
     ax.xaxis.tick_top()
     ax.xaxis.set_label_position('top')
     ax.yaxis.set_visible(False)
-    
+
     # Remove y-axis label
     ax.set_ylabel("")
 
     def update(frame):
-        if frame == 0:
-            # First frame: just show initial head position
-            x_data = [head]
-            y_data = [-1]
-            current_point.set_offsets([[head, -1]])
-        else:
-            # Subsequent frames: show movement from head to sequence points
-            x_data = [head] + sequence[:frame]
-            y_data = [-1] + list(range(frame))
-            if frame < len(sequence):
-                current_point.set_offsets([[sequence[frame-1], frame-1]])
-        
-        line.set_data(x_data, y_data)
+        end = min(frame * frame_step, count)
+        line.set_data(x_data[:end + 1], y_data[:end + 1])
+        current_point.set_offsets([[x_data[end], y_data[end]]])
         return line, current_point
 
-    ani = FuncAnimation(fig, update, frames=len(sequence) + 1,  # +1 to include initial position
-                        interval=500, blit=True, repeat=False)
+    ani = FuncAnimation(fig, update, frames=frames, interval=interval, blit=True, repeat=False)
 
     plt.tight_layout()
     plt.show()
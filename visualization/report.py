@@ -0,0 +1,76 @@
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+# Paths longer than this are drawn as a min/max envelope per row of pixels
+MAX_POINTS = 10_000
+ENVELOPE_ROWS = 2_000
+
+
+def _head_path(sequence, head):
+    path = np.empty(len(sequence) + 1, dtype=float)
+    path[0] = head
+    path[1:] = sequence
+    return path
+
+
+def _envelope(path, rows):
+    # Split the path into equal runs of steps and keep only the leftmost and
+    # rightmost track in each, which is all a pixel row can show anyway.
+    starts = np.linspace(0, len(path), rows, endpoint=False).astype(np.int64)
+    starts = np.unique(starts)
+    low = np.minimum.reduceat(path, starts)
+    high = np.maximum.reduceat(path, starts)
+    return starts, low, high
+
+
+def draw_sequence(ax, sequence, head, disk_size=200, title=None, max_points=MAX_POINTS):
+    path = _head_path(sequence, head)
+    steps = np.arange(-1, len(path) - 1, dtype=float)
+
+    if len(path) <= max_points:
+        points = np.column_stack((path, steps))
+        segments = np.stack((points[:-1], points[1:]), axis=1)
+        ax.add_collection(LineCollection(segments, colors='b', linewidths=1))
+    else:
+        starts, low, high = _envelope(path, ENVELOPE_ROWS)
+        # Repeat the last run so the final step is covered too
+        rows = np.append(steps[starts], steps[-1])
+        ax.fill_betweenx(rows, np.append(low, low[-1]), np.append(high, high[-1]),
+                         color='b', edgecolor='b', linewidth=1, step='post')
+
+    ax.scatter([head], [-1], color='g', s=40, zorder=3, label="Initial Position")
+    ax.scatter([path[-1]], [steps[-1]], color='r', s=40, zorder=3, label="Final Position")
+    ax.set_xlim(0, disk_size)
+    ax.set_ylim(-1.5, max(len(path) - 1.5, 0))
+    ax.invert_yaxis()
+    ax.grid(True, linestyle='--', alpha=0.7)
+    ax.set_xlabel("Track Position")
+    ax.xaxis.tick_top()
+    ax.xaxis.set_label_position('top')
+    ax.yaxis.set_visible(False)
+    if title:
+        ax.set_title(title)
+
+
+def render_report(sequences, head, disk_size, path, max_points=MAX_POINTS, dpi=100):
+    """Write the head movement of each algorithm side by side to an image file.
+
+    `sequences` maps algorithm names to service sequences. The file type
+    (png, svg, pdf, ...) follows the extension of `path`. Rendering uses the
+    Agg canvas directly, so no GUI backend or pyplot state is touched.
+    """
+    panels = max(len(sequences), 1)
+    fig = Figure(figsize=(4 * panels, 6), dpi=dpi)
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, panels, squeeze=False)[0]
+
+    for ax, (algo, sequence) in zip(axes, sequences.items()):
+        draw_sequence(ax, sequence, head, disk_size, title=algo, max_points=max_points)
+
+    fig.suptitle(f"Disk Head Movement (Disk Size: {disk_size})")
+    if sequences:
+        axes[0].legend(loc="lower right")
+    fig.tight_layout()
+    fig.savefig(path)